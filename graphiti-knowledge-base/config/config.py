@@ -15,7 +15,59 @@ GRAPHITI_CONFIG = {
     "openai_api_key": os.getenv("OPENAI_API_KEY"),
     "telemetry_enabled": os.getenv("GRAPHITI_TELEMETRY_ENABLED", "false").lower() == "true",
     "falkordb_host": os.getenv("FALKORDB_HOST", "localhost"),
-    "falkordb_port": int(os.getenv("FALKORDB_PORT", "6379"))
+    "falkordb_port": int(os.getenv("FALKORDB_PORT", "6379")),
+    "falkordb_pool_size": int(os.getenv("FALKORDB_POOL_SIZE", "8")),
+    "ingest_concurrency": int(os.getenv("GRAPHITI_INGEST_CONCURRENCY", "4")),
+    "ingest_max_retries": int(os.getenv("GRAPHITI_INGEST_MAX_RETRIES", "2")),
+    "episode_chunk_chars": int(os.getenv("GRAPHITI_EPISODE_CHUNK_CHARS", "4000")),
+    "llm_requests_per_minute": int(os.getenv("GRAPHITI_LLM_RPM", "240")),
+    "llm_tokens_per_minute": int(os.getenv("GRAPHITI_LLM_TPM", "200000")),
+    "llm_rate_limit_retries": int(os.getenv("GRAPHITI_LLM_RATE_LIMIT_RETRIES", "8")),
+    "embedding_cache_enabled": os.getenv("GRAPHITI_EMBEDDING_CACHE", "true").lower() == "true",
+    "embedding_cache_path": os.getenv(
+        "GRAPHITI_EMBEDDING_CACHE_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "embedding_cache.sqlite3")
+    ),
+    "embedding_cache_max_entries": int(os.getenv("GRAPHITI_EMBEDDING_CACHE_MAX_ENTRIES", "5000")),
+    "ledger_path": os.getenv(
+        "GRAPHITI_LEDGER_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "ingestion_ledger.json")
+    ),
+    "spool_dir": os.getenv(
+        "GRAPHITI_SPOOL_DIR",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "spool")
+    ),
+    "spool_max_attempts": int(os.getenv("GRAPHITI_SPOOL_MAX_ATTEMPTS", "0")),
+    "spool_max_backoff": float(os.getenv("GRAPHITI_SPOOL_MAX_BACKOFF", "300")),
+    "spool_lease_timeout": float(os.getenv("GRAPHITI_SPOOL_LEASE_TIMEOUT", "120")),
+    "mcp_transport": os.getenv("GRAPHITI_MCP_TRANSPORT", "stdio"),
+    "mcp_host": os.getenv("GRAPHITI_MCP_HOST", "127.0.0.1"),
+    "mcp_port": int(os.getenv("GRAPHITI_MCP_PORT", "8765")),
+    "mcp_eager": os.getenv("GRAPHITI_MCP_EAGER", "false").lower() == "true",
+    "mcp_warmup_searches": os.getenv("GRAPHITI_MCP_WARMUP_SEARCHES", "true").lower() == "true",
+    "query_cache_size": int(os.getenv("GRAPHITI_QUERY_CACHE_SIZE", "256")),
+    "query_cache_ttl": float(os.getenv("GRAPHITI_QUERY_CACHE_TTL", "300")),
+    "search_result_depth": int(os.getenv("GRAPHITI_SEARCH_RESULT_DEPTH", "50")),
+    "search_cursor_ttl": float(os.getenv("GRAPHITI_SEARCH_CURSOR_TTL", "600")),
+    "metrics_path": os.getenv(
+        "GRAPHITI_METRICS_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "mcp_metrics.prom")
+    ),
+    "metrics_interval": float(os.getenv("GRAPHITI_METRICS_INTERVAL", "15")),
+    "offline_fallback": os.getenv("GRAPHITI_OFFLINE_FALLBACK", "true").lower() == "true",
+    "local_knowledge_path": os.getenv(
+        "GRAPHITI_LOCAL_KNOWLEDGE_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "toastmasters_knowledge.json")
+    ),
+    "backend_probe_timeout": float(os.getenv("GRAPHITI_BACKEND_PROBE_TIMEOUT", "1.0")),
+    "backend_retry_interval": float(os.getenv("GRAPHITI_BACKEND_RETRY_INTERVAL", "30")),
+    "mcp_max_concurrent_searches": int(os.getenv("GRAPHITI_MCP_MAX_SEARCHES", "4")),
+    "ingestion_log_path": os.getenv(
+        "GRAPHITI_INGESTION_LOG",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "ingestion_log.jsonl")
+    ),
+    "ingestion_log_max_bytes": int(os.getenv("GRAPHITI_INGESTION_LOG_MAX_BYTES", str(5 * 1024 * 1024))),
+    "ingestion_log_backups": int(os.getenv("GRAPHITI_INGESTION_LOG_BACKUPS", "5"))
 }
 
 def setup_environment():
@@ -35,4 +87,26 @@ if __name__ == "__main__":
     else:
         print("  OpenAI API Key: ❌ NOT SET")
     print(f"  Telemetry: {GRAPHITI_CONFIG['telemetry_enabled']}")
-    print(f"  FalkorDB: {GRAPHITI_CONFIG['falkordb_host']}:{GRAPHITI_CONFIG['falkordb_port']}")
+    print(f"  FalkorDB: {GRAPHITI_CONFIG['falkordb_host']}:{GRAPHITI_CONFIG['falkordb_port']} (pool: {GRAPHITI_CONFIG['falkordb_pool_size']})")
+    print(f"  Ingest concurrency: {GRAPHITI_CONFIG['ingest_concurrency']} (retries: {GRAPHITI_CONFIG['ingest_max_retries']})")
+    print(f"  Episode chunk size: {GRAPHITI_CONFIG['episode_chunk_chars']} characters")
+    print(f"  LLM budget: {GRAPHITI_CONFIG['llm_requests_per_minute']} requests/min, "
+          f"{GRAPHITI_CONFIG['llm_tokens_per_minute']} tokens/min "
+          f"(429 retries: {GRAPHITI_CONFIG['llm_rate_limit_retries']})")
+    print(f"  Embedding cache: {GRAPHITI_CONFIG['embedding_cache_enabled']} "
+          f"({GRAPHITI_CONFIG['embedding_cache_path']}, max {GRAPHITI_CONFIG['embedding_cache_max_entries']} entries)")
+    print(f"  Ingestion ledger: {GRAPHITI_CONFIG['ledger_path']}")
+    print(f"  Ingestion spool: {GRAPHITI_CONFIG['spool_dir']} (max attempts: {GRAPHITI_CONFIG['spool_max_attempts'] or 'unlimited'}, "
+          f"backoff up to {GRAPHITI_CONFIG['spool_max_backoff']:.0f}s, "
+          f"lease {GRAPHITI_CONFIG['spool_lease_timeout']:.0f}s)")
+    print(f"  MCP transport: {GRAPHITI_CONFIG['mcp_transport']} "
+          f"(SSE on {GRAPHITI_CONFIG['mcp_host']}:{GRAPHITI_CONFIG['mcp_port']})")
+    print(f"  MCP eager start: {GRAPHITI_CONFIG['mcp_eager']} (warm-up searches: {GRAPHITI_CONFIG['mcp_warmup_searches']})")
+    print(f"  Query cache: {GRAPHITI_CONFIG['query_cache_size']} entries, {GRAPHITI_CONFIG['query_cache_ttl']:.0f}s TTL")
+    print(f"  Search paging: {GRAPHITI_CONFIG['search_result_depth']} results per search, cursors kept {GRAPHITI_CONFIG['search_cursor_ttl']:.0f}s")
+    print(f"  Metrics file: {GRAPHITI_CONFIG['metrics_path']} (every {GRAPHITI_CONFIG['metrics_interval']:.0f}s)")
+    print(f"  Offline fallback: {GRAPHITI_CONFIG['offline_fallback']} ({GRAPHITI_CONFIG['local_knowledge_path']}, "
+          f"probe timeout {GRAPHITI_CONFIG['backend_probe_timeout']}s, retry every {GRAPHITI_CONFIG['backend_retry_interval']:.0f}s)")
+    print(f"  MCP concurrent searches: {GRAPHITI_CONFIG['mcp_max_concurrent_searches']}")
+    print(f"  Ingestion log: {GRAPHITI_CONFIG['ingestion_log_path']} "
+          f"(rotates at {GRAPHITI_CONFIG['ingestion_log_max_bytes']} bytes, keeps {GRAPHITI_CONFIG['ingestion_log_backups']})")
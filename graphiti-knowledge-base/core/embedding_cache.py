@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Embedding Cache for Toastmasters AI Agent
+Disk-backed cache of embedding vectors keyed by embedding model and
+normalized text, shared by every process that builds its Graphiti client
+through create_graphiti(), so repeated queries skip the provider round-trip.
+"""
+
+import atexit
+import hashlib
+import os
+import sqlite3
+import time
+from array import array
+from typing import Any, Dict, List, Optional
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace; Graphiti already flattens newlines before embedding"""
+    return " ".join(text.split())
+
+
+def embedder_model(embedder: Any) -> str:
+    """Identify the embedding model (and dimension) an embedder produces vectors for"""
+    config = getattr(embedder, "config", None)
+    model = getattr(config, "embedding_model", None) or type(embedder).__name__
+    dim = getattr(config, "embedding_dim", None)
+    return f"{model}:{dim}" if dim else str(model)
+
+
+class EmbeddingCache:
+    """SQLite file of float32 vectors, evicting least recently used entries past max_entries
+
+    Cache hits only read. Their last_used times are kept in memory and
+    written in one batch with the next put_many (before it evicts), once
+    `touch_flush_interval` seconds have passed, or on flush()/close().
+    """
+
+    def __init__(self, path: str, max_entries: int = 5000, touch_flush_interval: float = 30.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.touch_flush_interval = touch_flush_interval
+        self._touched: Dict[str, float] = {}
+        self._touched_flushed_at = time.monotonic()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Several processes (MCP server, scripts) may share the file
+        self._db = sqlite3.connect(path, timeout=5.0)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, model TEXT NOT NULL, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._db.commit()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{model}\0{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+    def get_many(self, model: str, texts: List[str]) -> Dict[str, List[float]]:
+        """Return cached vectors for whichever texts are cached, keyed by text"""
+        keys = {self.key(model, text): text for text in texts}
+        found: Dict[str, List[float]] = {}
+        placeholders = ",".join("?" * len(keys))
+        rows = self._db.execute(
+            f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", list(keys)
+        ).fetchall()
+        now = time.time()
+        for key, blob in rows:
+            found[keys[key]] = array("f", blob).tolist()
+            self._touched[key] = now
+        if self._touched and time.monotonic() - self._touched_flushed_at >= self.touch_flush_interval:
+            self.flush()
+        self.hits += len(found)
+        self.misses += len(set(texts) - set(found))
+        return found
+
+    def _flush_touched(self):
+        """Write pending last_used times; the caller commits"""
+        if self._touched:
+            self._db.executemany(
+                "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                [(last_used, key) for key, last_used in self._touched.items()]
+            )
+            self._touched.clear()
+        self._touched_flushed_at = time.monotonic()
+
+    def put_many(self, model: str, vectors: Dict[str, List[float]]):
+        """Store vectors keyed by text, then evict the least recently used overflow"""
+        now = time.time()
+        self._flush_touched()
+        self._db.executemany(
+            "INSERT OR REPLACE INTO embeddings (key, model, vector, last_used) VALUES (?, ?, ?, ?)",
+            [(self.key(model, text), model, array("f", vector).tobytes(), now) for text, vector in vectors.items()]
+        )
+        count = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        if count > self.max_entries:
+            # Trim to 90% so eviction does not run on every insert
+            excess = count - int(self.max_entries * 0.9)
+            self._db.execute(
+                "DELETE FROM embeddings WHERE key IN "
+                "(SELECT key FROM embeddings ORDER BY last_used LIMIT ?)", (excess,)
+            )
+        self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0],
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def flush(self):
+        """Write the last_used times of cache hits that are still pending"""
+        self._flush_touched()
+        self._db.commit()
+
+    def close(self):
+        if self._db is None:
+            return
+        self.flush()
+        self._db.close()
+        self._db = None
+
+
+def install_embedding_cache(embedder: Any, cache: EmbeddingCache):
+    """Route an embedder's create/create_batch for text input through the cache
+
+    Methods are replaced on the instance so Graphiti keeps seeing its own
+    embedder object; token-id inputs go straight to the provider.
+    """
+    if getattr(embedder, "embedding_cache", None) is not None:
+        return
+    model = embedder_model(embedder)
+    create = embedder.create
+    create_batch = getattr(embedder, "create_batch", None)
+
+    async def cached_create(input_data: Any, *args: Any, **kwargs: Any) -> List[float]:
+        if isinstance(input_data, str):
+            text = input_data
+        elif isinstance(input_data, list) and len(input_data) == 1 and isinstance(input_data[0], str):
+            text = input_data[0]
+        else:
+            return await create(input_data, *args, **kwargs)
+        cached = cache.get_many(model, [text])
+        if text in cached:
+            return cached[text]
+        vector = await create(input_data, *args, **kwargs)
+        cache.put_many(model, {text: vector})
+        return vector
+
+    async def cached_create_batch(input_data_list: List[str], *args: Any, **kwargs: Any) -> List[List[float]]:
+        cached = cache.get_many(model, input_data_list)
+        missing = list(dict.fromkeys(text for text in input_data_list if text not in cached))
+        if missing:
+            vectors = await create_batch(missing, *args, **kwargs)
+            fresh = dict(zip(missing, vectors))
+            cache.put_many(model, fresh)
+            cached.update(fresh)
+        return [cached[text] for text in input_data_list]
+
+    embedder.create = cached_create
+    if create_batch is not None:
+        embedder.create_batch = cached_create_batch
+    embedder.embedding_cache = cache
+
+
+_shared_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache(path: str, max_entries: int) -> EmbeddingCache:
+    """Process-wide cache instance, opened on first use"""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = EmbeddingCache(path, max_entries)
+        # Pending last_used times would otherwise be lost by runs that never close it
+        atexit.register(_shared_cache.close)
+    return _shared_cache
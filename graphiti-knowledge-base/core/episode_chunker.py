@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Episode Chunker for Toastmasters AI Agent
+Splits oversized episode bodies into section-sized chunks along the heading
+structure the knowledge episodes already use, so each chunk is extracted
+separately and search hits land on the relevant section.
+"""
+
+import re
+from typing import Any, Dict, List
+
+# "CORE APPLICATION ARCHITECTURE:" - starts a new top-level section
+TOP_HEADING = re.compile(r"^[A-Z0-9][A-Z0-9 /&()+,.-]*:$")
+# "Key Functions and Their Purpose:" or "MonthlySchedule Interface:"
+SUB_HEADING = re.compile(r"^[A-Za-z][^:]{0,78}:$")
+# "1. getAppropriateScheduleId(): Determines which ..."
+NUMBERED_ITEM = re.compile(r"^\d+\.\s")
+
+
+def _is_block_start(line: str) -> bool:
+    stripped = line.strip()
+    if not stripped or stripped.startswith("-"):
+        return False
+    return bool(TOP_HEADING.match(stripped) or SUB_HEADING.match(stripped) or NUMBERED_ITEM.match(stripped))
+
+
+def split_blocks(content: str) -> List[Dict[str, Any]]:
+    """Split content into heading-led blocks, tagging each with its top-level section"""
+    blocks = []
+    current: List[str] = []
+    section = ""
+    current_section = ""
+
+    for line in content.splitlines():
+        stripped = line.strip()
+        if _is_block_start(line) and any(l.strip() for l in current):
+            blocks.append({"section": current_section, "lines": current})
+            current = []
+        if not any(l.strip() for l in current):
+            if TOP_HEADING.match(stripped):
+                section = stripped.rstrip(":")
+            current_section = section
+        current.append(line)
+
+    if any(l.strip() for l in current):
+        blocks.append({"section": current_section, "lines": current})
+    return blocks
+
+
+def chunk_episode(content: str, max_chars: int = 4000) -> List[Dict[str, Any]]:
+    """Split an episode body into chunks of at most about max_chars characters
+
+    Chunks never straddle a top-level (ALL CAPS) section and only break at
+    heading or numbered-item boundaries; a single block larger than max_chars
+    becomes its own chunk. Each chunk is {"index", "total", "section", "heading", "body"}.
+    """
+    if len(content) <= max_chars:
+        return [{"index": 1, "total": 1, "section": "", "heading": "", "body": content}]
+
+    chunks: List[Dict[str, Any]] = []
+    current: List[str] = []
+    current_section = None
+    current_heading = ""
+
+    def flush():
+        body = "\n".join(current).strip("\n")
+        if body.strip():
+            chunks.append({"section": current_section or "", "heading": current_heading, "body": body})
+
+    for block in split_blocks(content):
+        block_text = "\n".join(block["lines"])
+        block_heading = next(l.strip().rstrip(":") for l in block["lines"] if l.strip())
+        size = sum(len(l) + 1 for l in current)
+        # Preamble before the first top-level heading joins the first section
+        new_section = block["section"] != current_section and bool(current_section)
+        if current and (new_section or size + len(block_text) > max_chars):
+            flush()
+            current = []
+        if not current or (not current_section and block["section"]):
+            current_section = block["section"]
+            current_heading = block_heading
+        current.extend(block["lines"])
+    flush()
+
+    for i, chunk in enumerate(chunks, 1):
+        chunk["index"] = i
+        chunk["total"] = len(chunks)
+    return chunks
+
+
+def chunk_name(parent_name: str, chunk: Dict[str, Any]) -> str:
+    """Episode name for a chunk, linking it back to its parent"""
+    if chunk["total"] == 1:
+        return parent_name
+    label = chunk["heading"] if not chunk["section"] or chunk["heading"] == chunk["section"] \
+        else f"{chunk['section']} / {chunk['heading']}"
+    return f"{parent_name} [{chunk['index']}/{chunk['total']}]: {label}"
+
+
+def chunk_body(parent_name: str, chunk: Dict[str, Any]) -> str:
+    """Episode body for a chunk, prefixed with its place in the parent episode"""
+    if chunk["total"] == 1:
+        return chunk["body"]
+    context = f"Part {chunk['index']} of {chunk['total']} of \"{parent_name}\""
+    if chunk["section"]:
+        context += f", section {chunk['section']}"
+    return f"{context}\n\n{chunk['body']}"
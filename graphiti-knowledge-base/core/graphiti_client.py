@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Shared Graphiti Client for Toastmasters AI Agent
+Builds Graphiti instances on top of a pooled FalkorDB connection and the
+disk-backed embedding cache, and keeps a single lazily created, process-wide
+instance for callers that ingest or search repeatedly.
+"""
+
+import asyncio
+import os
+import sys
+from typing import Optional
+
+# Import configuration
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
+from config import GRAPHITI_CONFIG, setup_environment
+
+from graphiti_core import Graphiti
+from graphiti_core.driver.falkordb_driver import FalkorDriver
+
+from embedding_cache import get_embedding_cache, install_embedding_cache
+
+try:
+    from falkordb.asyncio import FalkorDB
+    from redis.asyncio import BlockingConnectionPool
+    POOLING_AVAILABLE = True
+except ImportError:
+    POOLING_AVAILABLE = False
+
+
+def create_graphiti(pool_size: Optional[int] = None) -> Graphiti:
+    """Create a Graphiti instance whose FalkorDB connections come from a bounded pool"""
+    host = os.getenv("FALKORDB_HOST", "localhost")
+    port = int(os.getenv("FALKORDB_PORT", "6379"))
+
+    if not POOLING_AVAILABLE:
+        graphiti = Graphiti(graph_driver=FalkorDriver(host=host, port=port))
+    else:
+        # A blocking pool makes callers wait for a free connection instead of failing
+        pool = BlockingConnectionPool(
+            host=host,
+            port=port,
+            max_connections=pool_size or GRAPHITI_CONFIG["falkordb_pool_size"],
+            timeout=None
+        )
+        driver = FalkorDriver(falkor_db=FalkorDB(connection_pool=pool))
+        graphiti = Graphiti(graph_driver=driver)
+        graphiti._connection_pool = pool
+
+    embedder = getattr(graphiti, "embedder", None)
+    if GRAPHITI_CONFIG["embedding_cache_enabled"] and embedder is not None:
+        cache = get_embedding_cache(
+            GRAPHITI_CONFIG["embedding_cache_path"],
+            GRAPHITI_CONFIG["embedding_cache_max_entries"]
+        )
+        install_embedding_cache(embedder, cache)
+        graphiti._embedding_cache = cache
+    return graphiti
+
+
+async def close_graphiti(graphiti: Graphiti):
+    """Close a Graphiti instance, release its pooled connections and flush its embedding cache
+
+    The cache is shared by every instance in the process, so it is flushed
+    here rather than closed; it is closed at exit.
+    """
+    try:
+        await graphiti.close()
+    finally:
+        pool = getattr(graphiti, "_connection_pool", None)
+        if pool is not None:
+            await pool.disconnect()
+        cache = getattr(graphiti, "_embedding_cache", None)
+        if cache is not None:
+            cache.flush()
+
+
+class SharedGraphitiClient:
+    """Process-wide Graphiti instance, created on first use and reused afterwards
+
+    Pooled connections belong to the event loop that opened them, so the
+    instance is tied to one loop. It is closed when that loop shuts down
+    (asyncio.run() finalizes async generators before closing the loop), so
+    calling asyncio.run(quick_add_...) repeatedly does not leak sockets.
+    Using it from a different loop while it is still open raises RuntimeError.
+    """
+
+    def __init__(self):
+        self.graphiti: Optional[Graphiti] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._closer = None
+
+    async def get(self) -> Graphiti:
+        """Return the shared instance, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self.graphiti is not None and not self._loop.is_closed():
+                raise RuntimeError(
+                    "The shared Graphiti client is open on another event loop; "
+                    "call close_shared_graphiti() on that loop first"
+                )
+            # Only reachable if the old loop was closed without finalizing
+            # async generators; its sockets went with it
+            self.graphiti = None
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self.graphiti is None:
+                setup_environment()
+                self.graphiti = create_graphiti()
+                self._closer = self._close_at_loop_shutdown(self.graphiti)
+                await self._closer.__anext__()
+        return self.graphiti
+
+    async def _close_at_loop_shutdown(self, graphiti: Graphiti):
+        """Suspended async generator the loop finalizes on shutdown, closing `graphiti` on its own loop"""
+        try:
+            yield
+        finally:
+            if self.graphiti is graphiti:
+                await self.close()
+
+    async def close(self):
+        """Close the shared instance if it was created on the running loop"""
+        graphiti, self.graphiti = self.graphiti, None
+        closer, self._closer = self._closer, None
+        if graphiti is not None and self._loop is asyncio.get_running_loop():
+            await close_graphiti(graphiti)
+            if closer is not None and not closer.ag_running:
+                await closer.aclose()
+
+
+shared_client = SharedGraphitiClient()
+
+
+async def get_shared_graphiti() -> Graphiti:
+    """Get the process-wide Graphiti instance"""
+    return await shared_client.get()
+
+
+async def close_shared_graphiti():
+    """Close the process-wide Graphiti instance and its connection pool"""
+    await shared_client.close()
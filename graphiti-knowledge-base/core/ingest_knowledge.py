@@ -6,7 +6,6 @@ solutions, and learnings about the Toastmasters project.
 """
 
 import asyncio
-import json
 import os
 import sys
 from datetime import datetime
@@ -19,38 +18,52 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
-from config import setup_environment
+from config import GRAPHITI_CONFIG, setup_environment
+from ingestion_pipeline import run_bounded
+from ingestion_log import IngestionLog
+from rate_limiter import scheduled_add_episode
+from response_format import result_content
 
 try:
     from graphiti_core import Graphiti
-    from graphiti_core.driver.falkordb_driver import FalkorDriver
     GRAPHITI_AVAILABLE = True
 except ImportError:
     print("❌ Graphiti not installed. Please run: pip install graphiti-core[falkordb]")
     GRAPHITI_AVAILABLE = False
     sys.exit(1)
 
+from graphiti_client import close_graphiti, close_shared_graphiti, create_graphiti, get_shared_graphiti
+
 class KnowledgeIngestionManager:
-    def __init__(self):
-        self.graphiti = None
+    def __init__(self, graphiti: Optional[Graphiti] = None):
+        # A manager only closes the Graphiti connection it created itself
+        self.graphiti = graphiti
+        self.owns_graphiti = graphiti is None
+        # Entries from this process; only the ones not yet saved are appended to disk
         self.ingestion_log = []
+        self.saved_entries = 0
     
     async def initialize(self):
         """Initialize Graphiti connection"""
+        if self.graphiti:
+            return
         try:
             # Set up environment
             setup_environment()
             
-            driver = FalkorDriver(
-                host=os.getenv("FALKORDB_HOST", "localhost"),
-                port=int(os.getenv("FALKORDB_PORT", "6379"))
-            )
-            self.graphiti = Graphiti(graph_driver=driver)
+            self.graphiti = create_graphiti()
+            self.owns_graphiti = True
             print("✅ Knowledge Ingestion Manager initialized")
         except Exception as e:
             print(f"❌ Failed to initialize: {e}")
             raise
     
+    async def close(self):
+        """Close the Graphiti connection if this manager created it"""
+        if self.graphiti and self.owns_graphiti:
+            await close_graphiti(self.graphiti)
+            self.graphiti = None
+    
     async def add_insight(self, 
                          title: str, 
                          content: str, 
@@ -59,8 +72,58 @@ class KnowledgeIngestionManager:
                          tags: Optional[List[str]] = None) -> bool:
         """Add a new insight to the knowledge base"""
         try:
-            # Create structured content
-            structured_content = f"""
+            await self._ingest_insight(title, content, category, entities, tags)
+            print(f"✅ Added insight: {title}")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Failed to add insight '{title}': {e}")
+            return False
+    
+    async def add_insights(self,
+                           insights: List[Dict[str, Any]],
+                           concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Add many insights at once over a single Graphiti connection
+        
+        Each insight is a dict of add_insight keyword arguments (see the
+        build_* helpers). Returns one {"title", "success", "error"} dict per
+        insight, in input order.
+        """
+        if not self.graphiti:
+            await self.initialize()
+        
+        async def ingest(insight):
+            await self._ingest_insight(**insight)
+        
+        def report(outcome):
+            title = insights[outcome["index"]]["title"]
+            if outcome["success"]:
+                print(f"✅ Added insight: {title}")
+            else:
+                print(f"❌ Failed to add insight '{title}': {outcome['error']}")
+        
+        results = await run_bounded(
+            insights,
+            ingest,
+            concurrency=concurrency or GRAPHITI_CONFIG["ingest_concurrency"],
+            max_retries=GRAPHITI_CONFIG["ingest_max_retries"],
+            on_result=report
+        )
+        
+        return [
+            {"title": insight["title"], "success": outcome["success"], "error": outcome["error"]}
+            for insight, outcome in zip(insights, results)
+        ]
+    
+    async def _ingest_insight(self,
+                              title: str,
+                              content: str,
+                              category: str,
+                              entities: List[str],
+                              tags: Optional[List[str]] = None):
+        """Send one insight to Graphiti and log it, raising on failure"""
+        # Create structured content
+        structured_content = f"""
             {title}
             
             Category: {category}
@@ -68,38 +131,36 @@ class KnowledgeIngestionManager:
             
             {content}
             """
-            
-            if tags:
-                structured_content += f"\nTags: {', '.join(tags)}"
-            
-            # Add to Graphiti
-            await self.graphiti.add_episode(
-                content=structured_content,
-                entities=entities
-            )
-            
-            # Log the ingestion
-            self.ingestion_log.append({
-                "timestamp": datetime.now().isoformat(),
-                "title": title,
-                "category": category,
-                "entities": entities
-            })
-            
-            print(f"✅ Added insight: {title}")
-            return True
-            
-        except Exception as e:
-            print(f"❌ Failed to add insight '{title}': {e}")
-            return False
+        
+        if tags:
+            structured_content += f"\nTags: {', '.join(tags)}"
+        
+        # Add to Graphiti, within the provider's rate limits; Graphiti extracts
+        # entities itself, so ours only go into the source description
+        await scheduled_add_episode(
+            self.graphiti,
+            structured_content,
+            name=title,
+            episode_body=structured_content,
+            source_description=f"{category} insight" + (f" (entities: {', '.join(entities)})" if entities else ""),
+            reference_time=datetime.now()
+        )
+        
+        # Log the ingestion
+        self.ingestion_log.append({
+            "timestamp": datetime.now().isoformat(),
+            "title": title,
+            "category": category,
+            "entities": entities
+        })
     
-    async def add_bug_fix(self, 
-                         bug_description: str, 
-                         solution: str, 
-                         files_changed: List[str],
-                         testing_notes: str = "") -> bool:
-        """Add information about a bug fix"""
-        return await self.add_insight(
+    @staticmethod
+    def build_bug_fix(bug_description: str, 
+                      solution: str, 
+                      files_changed: List[str],
+                      testing_notes: str = "") -> Dict[str, Any]:
+        """Build the insight for a bug fix"""
+        return dict(
             title=f"Bug Fix: {bug_description[:50]}...",
             content=f"""
             Bug Description: {bug_description}
@@ -118,14 +179,14 @@ class KnowledgeIngestionManager:
             tags=["bug", "fix", "solution"]
         )
     
-    async def add_feature_implementation(self, 
-                                       feature_name: str, 
-                                       description: str, 
-                                       implementation_details: str,
-                                       files_created: List[str],
-                                       files_modified: List[str]) -> bool:
-        """Add information about a new feature implementation"""
-        return await self.add_insight(
+    @staticmethod
+    def build_feature_implementation(feature_name: str, 
+                                     description: str, 
+                                     implementation_details: str,
+                                     files_created: List[str],
+                                     files_modified: List[str]) -> Dict[str, Any]:
+        """Build the insight for a new feature implementation"""
+        return dict(
             title=f"Feature: {feature_name}",
             content=f"""
             Feature Description: {description}
@@ -144,12 +205,12 @@ class KnowledgeIngestionManager:
             tags=["feature", "implementation", "new"]
         )
     
-    async def add_user_feedback(self, 
-                               feedback_type: str, 
-                               content: str, 
-                               action_taken: str) -> bool:
-        """Add user feedback and actions taken"""
-        return await self.add_insight(
+    @staticmethod
+    def build_user_feedback(feedback_type: str, 
+                            content: str, 
+                            action_taken: str) -> Dict[str, Any]:
+        """Build the insight for user feedback and actions taken"""
+        return dict(
             title=f"User Feedback: {feedback_type}",
             content=f"""
             Feedback Type: {feedback_type}
@@ -165,13 +226,13 @@ class KnowledgeIngestionManager:
             tags=["feedback", "user", "action"]
         )
     
-    async def add_architecture_decision(self, 
-                                      decision: str, 
-                                      rationale: str, 
-                                      alternatives_considered: List[str],
-                                      impact: str) -> bool:
-        """Add architectural decisions and their rationale"""
-        return await self.add_insight(
+    @staticmethod
+    def build_architecture_decision(decision: str, 
+                                    rationale: str, 
+                                    alternatives_considered: List[str],
+                                    impact: str) -> Dict[str, Any]:
+        """Build the insight for an architectural decision and its rationale"""
+        return dict(
             title=f"Architecture Decision: {decision[:50]}...",
             content=f"""
             Decision: {decision}
@@ -190,10 +251,51 @@ class KnowledgeIngestionManager:
             tags=["architecture", "decision", "design"]
         )
     
+    async def add_bug_fix(self, 
+                         bug_description: str, 
+                         solution: str, 
+                         files_changed: List[str],
+                         testing_notes: str = "") -> bool:
+        """Add information about a bug fix"""
+        return await self.add_insight(
+            **self.build_bug_fix(bug_description, solution, files_changed, testing_notes)
+        )
+    
+    async def add_feature_implementation(self, 
+                                       feature_name: str, 
+                                       description: str, 
+                                       implementation_details: str,
+                                       files_created: List[str],
+                                       files_modified: List[str]) -> bool:
+        """Add information about a new feature implementation"""
+        return await self.add_insight(
+            **self.build_feature_implementation(feature_name, description, implementation_details,
+                                                files_created, files_modified)
+        )
+    
+    async def add_user_feedback(self, 
+                               feedback_type: str, 
+                               content: str, 
+                               action_taken: str) -> bool:
+        """Add user feedback and actions taken"""
+        return await self.add_insight(
+            **self.build_user_feedback(feedback_type, content, action_taken)
+        )
+    
+    async def add_architecture_decision(self, 
+                                      decision: str, 
+                                      rationale: str, 
+                                      alternatives_considered: List[str],
+                                      impact: str) -> bool:
+        """Add architectural decisions and their rationale"""
+        return await self.add_insight(
+            **self.build_architecture_decision(decision, rationale, alternatives_considered, impact)
+        )
+    
     async def search_knowledge(self, query: str, limit: int = 5) -> List[Any]:
         """Search the knowledge base"""
         try:
-            return await self.graphiti.search(query, limit=limit)
+            return await self.graphiti.search(query, num_results=limit)
         except Exception as e:
             print(f"❌ Search failed: {e}")
             return []
@@ -206,12 +308,12 @@ class KnowledgeIngestionManager:
             summary = {}
             
             for category in categories:
-                results = await self.graphiti.search(f"category: {category}", limit=10)
+                results = await self.graphiti.search(f"category: {category}", num_results=10)
                 summary[category] = len(results)
             
             # Get recent entries
-            recent_results = await self.graphiti.search("recent", limit=5)
-            summary["recent_entries"] = [r.content[:100] + "..." for r in recent_results]
+            recent_results = await self.graphiti.search("recent", num_results=5)
+            summary["recent_entries"] = [result_content(r)[:100] + "..." for r in recent_results]
             
             summary["total_insights"] = len(self.ingestion_log)
             summary["last_updated"] = datetime.now().isoformat()
@@ -222,36 +324,52 @@ class KnowledgeIngestionManager:
             print(f"❌ Failed to get summary: {e}")
             return {}
     
-    def save_ingestion_log(self, filename: str = "ingestion_log.json"):
-        """Save the ingestion log to a file"""
+    def save_ingestion_log(self, filename: Optional[str] = None):
+        """Append entries added since the last save to the JSONL ingestion log"""
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.ingestion_log, f, indent=2)
-            print(f"✅ Ingestion log saved to {filename}")
+            log = IngestionLog(filename or GRAPHITI_CONFIG["ingestion_log_path"],
+                               GRAPHITI_CONFIG["ingestion_log_max_bytes"],
+                               GRAPHITI_CONFIG["ingestion_log_backups"])
+            log.append(self.ingestion_log[self.saved_entries:])
+            self.saved_entries = len(self.ingestion_log)
+            print(f"✅ Ingestion log saved to {log.path}")
         except Exception as e:
             print(f"❌ Failed to save log: {e}")
 
 # Convenience functions for AI agents to use
+_shared_manager: Optional[KnowledgeIngestionManager] = None
+
+async def get_shared_manager() -> KnowledgeIngestionManager:
+    """Get a manager backed by the process-wide pooled Graphiti client"""
+    global _shared_manager
+    graphiti = await get_shared_graphiti()
+    if _shared_manager is None or _shared_manager.graphiti is not graphiti:
+        _shared_manager = KnowledgeIngestionManager(graphiti=graphiti)
+    return _shared_manager
+
+async def close_shared_manager():
+    """Close the shared Graphiti client used by the quick_add_* helpers"""
+    global _shared_manager
+    _shared_manager = None
+    await close_shared_graphiti()
+
 async def quick_add_bug_fix(description: str, solution: str, files: List[str]):
     """Quick function to add a bug fix"""
-    manager = KnowledgeIngestionManager()
-    await manager.initialize()
+    manager = await get_shared_manager()
     await manager.add_bug_fix(description, solution, files)
-    await manager.save_ingestion_log()
+    manager.save_ingestion_log()
 
 async def quick_add_feature(name: str, description: str, implementation: str, files_created: List[str], files_modified: List[str]):
     """Quick function to add a feature implementation"""
-    manager = KnowledgeIngestionManager()
-    await manager.initialize()
+    manager = await get_shared_manager()
     await manager.add_feature_implementation(name, description, implementation, files_created, files_modified)
-    await manager.save_ingestion_log()
+    manager.save_ingestion_log()
 
 async def quick_add_user_feedback(feedback_type: str, content: str, action: str):
     """Quick function to add user feedback"""
-    manager = KnowledgeIngestionManager()
-    await manager.initialize()
+    manager = await get_shared_manager()
     await manager.add_user_feedback(feedback_type, content, action)
-    await manager.save_ingestion_log()
+    manager.save_ingestion_log()
 
 # Example usage and testing
 async def main():
@@ -287,6 +405,7 @@ async def main():
     
     # Save log
     manager.save_ingestion_log()
+    await manager.close()
     
     print("\n✅ Knowledge ingestion examples completed!")
 
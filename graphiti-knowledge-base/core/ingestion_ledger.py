@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Ingestion Ledger for Toastmasters AI Agent
+Remembers which episode bodies have already been ingested into Graphiti,
+keyed by a hash of their normalized content, so reruns can skip them.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+def normalize_content(content: str) -> str:
+    """Collapse whitespace so re-indented copies of an episode hash the same"""
+    return " ".join(content.split())
+
+
+def content_hash(content: str) -> str:
+    """Return the SHA-256 hex digest of the normalized content"""
+    return hashlib.sha256(normalize_content(content).encode("utf-8")).hexdigest()
+
+
+class IngestionLedger:
+    def __init__(self, path: str):
+        self.path = path
+        # content hash -> entry, and episode name -> its currently ingested version
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.versions: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self):
+        """Load the ledger from disk, starting empty if it does not exist"""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.entries = data.get("episodes", {})
+            self.versions = data.get("versions", {})
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable ingestion ledger {self.path}: {e}")
+
+    def save(self):
+        """Write the ledger atomically so a crash never leaves it half-written"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"episodes": self.entries, "versions": self.versions}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def contains(self, content: str) -> bool:
+        """Check whether this content has already been ingested"""
+        return content_hash(content) in self.entries
+
+    def get(self, content: str) -> Optional[Dict[str, Any]]:
+        """Return the ledger entry for this content, if any"""
+        return self.entries.get(content_hash(content))
+
+    def record(self, content: str, name: str, **metadata: Any):
+        """Record that this content was ingested and persist the ledger"""
+        self.entries[content_hash(content)] = {
+            "name": name,
+            "ingested_at": datetime.now().isoformat(),
+            **metadata
+        }
+        self.save()
+
+    def get_version(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the last ingested version of a named episode
+
+        A version is {"hash", "sections", "stale"}: the hash of the full body
+        (None while an update is incomplete), the live sections keyed by
+        section hash, and superseded sections still waiting to be removed.
+        """
+        return self.versions.get(name)
+
+    def set_version(self, name: str, version: Dict[str, Any]):
+        """Store the current version of a named episode and persist the ledger"""
+        self.versions[name] = {**version, "updated_at": datetime.now().isoformat()}
+        self.save()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Ingestion Log for Toastmasters AI Agent
+Append-only, line-delimited JSON log of everything added to the knowledge base.
+The log rotates by size, can be compacted into a single file, and is read one
+line at a time so history never has to fit in memory.
+"""
+
+import json
+import os
+import sys
+from typing import Any, Dict, Iterator, List
+
+
+class IngestionLog:
+    def __init__(self, path: str, max_bytes: int = 5 * 1024 * 1024, backups: int = 5):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+    def segments(self) -> List[str]:
+        """Existing log files, oldest first"""
+        rotated = [f"{self.path}.{i}" for i in range(self.backups, 0, -1)]
+        return [path for path in rotated + [self.path] if os.path.exists(path)]
+
+    def append(self, entries: List[Dict[str, Any]]):
+        """Append entries as JSON lines, rotating first if the log is full"""
+        if not entries:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+            self.rotate()
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def rotate(self):
+        """Shift log.N-1 to log.N, ..., log to log.1, dropping the oldest backup"""
+        if self.backups <= 0:
+            os.remove(self.path)
+            return
+        oldest = f"{self.path}.{self.backups}"
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for i in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"):
+                os.replace(f"{self.path}.{i}", f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """Stream entries from the oldest segment to the newest, skipping bad lines"""
+        for path in self.segments():
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+
+    def compact(self) -> int:
+        """Merge all segments into one file, dropping malformed and duplicate lines
+
+        Returns the number of entries kept.
+        """
+        segments = self.segments()
+        if not segments:
+            return 0
+        tmp_path = f"{self.path}.compact"
+        seen = set()
+        kept = 0
+        with open(tmp_path, 'w', encoding='utf-8') as out:
+            for entry in self.iter_entries():
+                line = json.dumps(entry, ensure_ascii=False, sort_keys=True)
+                if line in seen:
+                    continue
+                seen.add(line)
+                out.write(line + "\n")
+                kept += 1
+        os.replace(tmp_path, self.path)
+        for path in segments:
+            if path != self.path:
+                os.remove(path)
+        return kept
+
+
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
+    from config import GRAPHITI_CONFIG
+
+    log = IngestionLog(GRAPHITI_CONFIG["ingestion_log_path"],
+                       GRAPHITI_CONFIG["ingestion_log_max_bytes"],
+                       GRAPHITI_CONFIG["ingestion_log_backups"])
+    if len(sys.argv) > 1 and sys.argv[1] == "compact":
+        print(f"✅ Compacted ingestion log to {log.compact()} entries")
+    else:
+        count = sum(1 for _ in log.iter_entries())
+        print(f"Ingestion log: {log.path}")
+        print(f"  Segments: {len(log.segments())}")
+        print(f"  Entries: {count}")
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Ingestion Pipeline Helpers for Toastmasters AI Agent
+Runs knowledge base ingestion work with bounded concurrency, per-item retries
+and progress reporting in the original episode order.
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+# Import configuration
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
+from config import GRAPHITI_CONFIG
+from episode_chunker import chunk_body, chunk_episode, chunk_name
+from ingestion_ledger import content_hash
+from rate_limiter import scheduled_add_episode
+
+
+async def run_bounded(items: Sequence[Any],
+                      worker: Callable[[Any], Awaitable[Any]],
+                      concurrency: int = 4,
+                      max_retries: int = 2,
+                      retry_delay: float = 1.0,
+                      on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+                      semaphore: Optional[asyncio.Semaphore] = None) -> List[Dict[str, Any]]:
+    """Run worker over items with at most `concurrency` calls in flight.
+
+    Each item is retried up to `max_retries` times with exponential backoff.
+    Returns one result dict per item, in input order. `on_result` is called
+    once per item, also in input order, as soon as every earlier item is done.
+    Pass `semaphore` to share one concurrency limit between several pools.
+    """
+    semaphore = semaphore or asyncio.Semaphore(max(1, concurrency))
+    results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+    next_to_report = 0
+
+    def report_ready():
+        nonlocal next_to_report
+        while next_to_report < len(results) and results[next_to_report] is not None:
+            if on_result:
+                on_result(results[next_to_report])
+            next_to_report += 1
+
+    async def run_one(index: int, item: Any):
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                async with semaphore:
+                    value = await worker(item)
+                outcome = {"index": index, "success": True, "result": value, "error": None, "attempts": attempts}
+                break
+            except Exception as e:
+                if attempts > max_retries:
+                    outcome = {"index": index, "success": False, "result": None, "error": str(e), "attempts": attempts}
+                    break
+                await asyncio.sleep(retry_delay * (2 ** (attempts - 1)))
+
+        results[index] = outcome
+        report_ready()
+
+    await asyncio.gather(*(run_one(i, item) for i, item in enumerate(items)))
+    return results
+
+
+async def add_episode(graphiti,
+                      name: str,
+                      episode_body: str,
+                      source_description: str,
+                      reference_time: Optional[datetime] = None) -> Optional[str]:
+    """Add one episode to Graphiti and return its uuid when Graphiti reports one"""
+    # Every ingestion call goes through the shared rate-limit scheduler
+    result = await scheduled_add_episode(
+        graphiti,
+        episode_body,
+        name=name,
+        episode_body=episode_body,
+        source_description=source_description,
+        reference_time=reference_time or datetime.now()
+    )
+    return getattr(getattr(result, "episode", None), "uuid", None)
+
+
+async def remove_episodes(graphiti, sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Remove superseded episodes from Graphiti, returning the ones that could not be removed"""
+    remaining = []
+    for section in sections:
+        uuid = section.get("episode_uuid")
+        if not uuid or not hasattr(graphiti, "remove_episode"):
+            continue
+        try:
+            await graphiti.remove_episode(uuid)
+        except Exception as e:
+            print(f"⚠️ Could not remove superseded episode '{section.get('name')}': {e}")
+            remaining.append(section)
+    return remaining
+
+
+async def ingest_episode(graphiti,
+                         ledger,
+                         name: str,
+                         episode_body: str,
+                         source_description: str,
+                         reference_time: Optional[datetime] = None,
+                         force: bool = False,
+                         max_chunk_chars: Optional[int] = None,
+                         concurrency: Optional[int] = None,
+                         max_retries: Optional[int] = None,
+                         semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, int]:
+    """Ingest an episode, re-extracting only the sections that changed since the last run.
+
+    Oversized bodies are split into section chunks (see episode_chunker),
+    which are added in parallel and named after their parent. When the ledger
+    holds an earlier version of the episode under the same name, sections
+    whose text is unchanged are kept, new or edited sections are added, and
+    episodes for sections that no longer exist are removed from Graphiti so
+    their facts stop being returned. force=True re-ingests every section.
+
+    Returns counts {"chunks", "added", "skipped", "removed"}. Raises
+    RuntimeError if any section still fails after retries; sections that did
+    succeed are kept, so the next run only retries the failures.
+
+    When several episodes are ingested at once, pass them one shared
+    `semaphore` so `concurrency` bounds the add_episode calls of all of them.
+    Chunk size, concurrency and retries default to GRAPHITI_EPISODE_CHUNK_CHARS,
+    GRAPHITI_INGEST_CONCURRENCY and GRAPHITI_INGEST_MAX_RETRIES.
+    """
+    if max_chunk_chars is None:
+        max_chunk_chars = GRAPHITI_CONFIG["episode_chunk_chars"]
+    if concurrency is None:
+        concurrency = GRAPHITI_CONFIG["ingest_concurrency"]
+    if max_retries is None:
+        max_retries = GRAPHITI_CONFIG["ingest_max_retries"]
+    body_hash = content_hash(episode_body)
+    previous = (ledger.get_version(name) if ledger is not None else None) or {}
+
+    if ledger is not None and not force:
+        if previous.get("hash") == body_hash:
+            total = len(previous.get("sections", {}))
+            return {"chunks": total, "added": 0, "skipped": total, "removed": 0}
+        if not previous and ledger.contains(episode_body):
+            # Ingested before versions were tracked, or under another name
+            total = len(ledger.get(episode_body).get("chunks", [])) or 1
+            return {"chunks": total, "added": 0, "skipped": total, "removed": 0}
+
+    chunks = chunk_episode(episode_body, max_chunk_chars)
+    new_sections = {content_hash(chunk["body"]): chunk for chunk in chunks}
+    old_sections = previous.get("sections", {})
+    stale = list(previous.get("stale", []))
+
+    if force:
+        keep = {}
+        stale += list(old_sections.values())
+    else:
+        keep = {h: section for h, section in old_sections.items() if h in new_sections}
+        stale += [section for h, section in old_sections.items() if h not in new_sections]
+
+    to_add = [(h, chunk) for h, chunk in new_sections.items() if h not in keep]
+    reference_time = reference_time or datetime.now()
+
+    async def add_section(item):
+        section_hash, chunk = item
+        section_name = chunk_name(name, chunk)
+        uuid = await add_episode(
+            graphiti,
+            name=section_name,
+            episode_body=chunk_body(name, chunk),
+            source_description=source_description if chunk["total"] == 1
+            else f"{source_description} (part {chunk['index']} of {chunk['total']})",
+            reference_time=reference_time
+        )
+        return section_hash, {"name": section_name, "section": chunk["section"], "episode_uuid": uuid}
+
+    results = await run_bounded(to_add, add_section, concurrency=concurrency, max_retries=max_retries,
+                                semaphore=semaphore)
+    sections = dict(keep)
+    sections.update(outcome["result"] for outcome in results if outcome["success"])
+    failures = [outcome for outcome in results if not outcome["success"]]
+
+    if failures:
+        # Keep superseded sections until every replacement is in the graph
+        if ledger is not None:
+            ledger.set_version(name, {"hash": None, "sections": sections, "stale": stale})
+        raise RuntimeError(f"{len(failures)} of {len(to_add)} sections of '{name}' failed: {failures[0]['error']}")
+
+    remaining = await remove_episodes(graphiti, stale)
+    if ledger is not None:
+        ledger.set_version(name, {"hash": body_hash, "sections": sections, "stale": remaining})
+        ledger.record(episode_body, name, source_description=source_description,
+                      chunks=list(new_sections))
+
+    return {
+        "chunks": len(chunks),
+        "added": len(to_add),
+        "skipped": len(chunks) - len(to_add),
+        "removed": len(stale) - len(remaining)
+    }
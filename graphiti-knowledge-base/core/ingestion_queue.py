@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Durable Ingestion Queue for Toastmasters AI Agent
+An on-disk spool of knowledge to add to Graphiti, plus a background worker
+that drains it with retries. Jobs survive crashes and restarts: a job in
+flight holds a lease (the mtime of its processing file, refreshed by the
+worker's heartbeat), and once the lease expires any worker sharing the spool
+puts it back in the queue.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# Job states, each backed by a subdirectory of the spool
+PENDING = "pending"
+PROCESSING = "processing"
+DONE = "done"
+FAILED = "failed"
+
+
+class IngestionQueue:
+    def __init__(self, spool_dir: str, max_done: int = 200, lease_timeout: float = 120.0):
+        self.spool_dir = spool_dir
+        self.max_done = max_done
+        self.lease_timeout = lease_timeout
+        for state in (PENDING, PROCESSING, DONE, FAILED):
+            os.makedirs(os.path.join(spool_dir, state), exist_ok=True)
+
+    def _path(self, state: str, job_id: str) -> str:
+        return os.path.join(self.spool_dir, state, f"{job_id}.json")
+
+    def _write(self, state: str, job: Dict[str, Any]):
+        """Write a job file atomically"""
+        path = self._path(state, job["id"])
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(job, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def _read(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def enqueue(self, payload: Dict[str, Any]) -> str:
+        """Spool a payload and return its job id"""
+        # Time-prefixed ids keep the spool in FIFO order when sorted
+        job_id = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+        self._write(PENDING, {
+            "id": job_id,
+            "created": datetime.now().isoformat(),
+            "attempts": 0,
+            "next_attempt_at": 0,
+            "last_error": None,
+            "payload": payload
+        })
+        return job_id
+
+    def recover(self) -> int:
+        """Return jobs whose lease expired (their worker died) to the pending queue
+
+        Several server processes share one spool, so jobs another live worker
+        is still heartbeating are left alone.
+        """
+        recovered = 0
+        processing_dir = os.path.join(self.spool_dir, PROCESSING)
+        stale_before = time.time() - self.lease_timeout
+        for filename in os.listdir(processing_dir):
+            if not filename.endswith(".json"):
+                continue
+            path = os.path.join(processing_dir, filename)
+            try:
+                if os.path.getmtime(path) > stale_before:
+                    continue
+                os.replace(path, os.path.join(self.spool_dir, PENDING, filename))
+            except FileNotFoundError:
+                # Finished, or recovered by another worker, since the listing
+                continue
+            recovered += 1
+        return recovered
+
+    def claim(self) -> Optional[Dict[str, Any]]:
+        """Move the oldest job that is due from pending to processing"""
+        pending_dir = os.path.join(self.spool_dir, PENDING)
+        now = time.time()
+        for filename in sorted(os.listdir(pending_dir)):
+            if not filename.endswith(".json"):
+                continue
+            job = self._read(os.path.join(pending_dir, filename))
+            if job is None or job.get("next_attempt_at", 0) > now:
+                continue
+            try:
+                # Touch first so the job enters processing/ with a fresh lease
+                os.utime(os.path.join(pending_dir, filename))
+                os.replace(os.path.join(pending_dir, filename),
+                           os.path.join(self.spool_dir, PROCESSING, filename))
+            except FileNotFoundError:
+                continue
+            return job
+        return None
+
+    def heartbeat(self, job: Dict[str, Any]) -> bool:
+        """Renew a claimed job's lease; False if another worker already recovered it"""
+        try:
+            os.utime(self._path(PROCESSING, job["id"]))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def complete(self, job: Dict[str, Any]):
+        """Record a job as done, keeping only a small marker for status lookups"""
+        self._write(DONE, {
+            "id": job["id"],
+            "created": job["created"],
+            "finished": datetime.now().isoformat(),
+            "attempts": job["attempts"]
+        })
+        try:
+            os.remove(self._path(PROCESSING, job["id"]))
+        except FileNotFoundError:
+            # The lease expired and the job was re-queued; drop the copy so it is not ingested again
+            try:
+                os.remove(self._path(PENDING, job["id"]))
+            except FileNotFoundError:
+                pass
+        self._prune_done()
+
+    def retry(self, job: Dict[str, Any], error: str, max_attempts: int, backoff: float, max_backoff: float):
+        """Put a failed job back in the queue, or park it in failed/ when out of attempts
+
+        The delay doubles per attempt up to max_backoff. With max_attempts 0
+        a job is retried until it succeeds, so an outage of any length does
+        not lose knowledge.
+        """
+        if not os.path.exists(self._path(PROCESSING, job["id"])):
+            # The lease expired and another worker already re-queued the job
+            return
+        job["last_error"] = error
+        if max_attempts and job["attempts"] >= max_attempts:
+            self._write(FAILED, job)
+        else:
+            job["next_attempt_at"] = time.time() + min(backoff * (2 ** (job["attempts"] - 1)), max_backoff)
+            self._write(PENDING, job)
+        os.remove(self._path(PROCESSING, job["id"]))
+
+    def requeue_failed(self) -> int:
+        """Give jobs parked in failed/ a fresh set of attempts"""
+        requeued = 0
+        failed_dir = os.path.join(self.spool_dir, FAILED)
+        for filename in os.listdir(failed_dir):
+            if not filename.endswith(".json"):
+                continue
+            job = self._read(os.path.join(failed_dir, filename))
+            if job is None:
+                continue
+            job["attempts"] = 0
+            job["next_attempt_at"] = 0
+            self._write(PENDING, job)
+            try:
+                os.remove(os.path.join(failed_dir, filename))
+            except FileNotFoundError:
+                pass
+            requeued += 1
+        return requeued
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        """Look up a job's state by id"""
+        for state in (PENDING, PROCESSING, DONE, FAILED):
+            job = self._read(self._path(state, job_id))
+            if job is not None:
+                job.pop("payload", None)
+                return {"state": state, **job}
+        return {"state": "unknown", "id": job_id}
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs in each state"""
+        return {
+            state: sum(1 for f in os.listdir(os.path.join(self.spool_dir, state)) if f.endswith(".json"))
+            for state in (PENDING, PROCESSING, DONE, FAILED)
+        }
+
+    def _prune_done(self):
+        done_dir = os.path.join(self.spool_dir, DONE)
+        finished = sorted(f for f in os.listdir(done_dir) if f.endswith(".json"))
+        for filename in finished[:-self.max_done] if self.max_done else finished:
+            os.remove(os.path.join(done_dir, filename))
+
+
+class IngestionWorker:
+    def __init__(self,
+                 queue: IngestionQueue,
+                 ingest: Callable[[Dict[str, Any]], Awaitable[Any]],
+                 max_attempts: int = 0,
+                 backoff: float = 2.0,
+                 max_backoff: float = 300.0,
+                 poll_interval: float = 1.0,
+                 on_complete: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.queue = queue
+        self.ingest = ingest
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.poll_interval = poll_interval
+        self.on_complete = on_complete
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def notify(self):
+        """Wake the worker after a new job is spooled"""
+        self._wakeup.set()
+
+    def start(self) -> asyncio.Task:
+        """Start draining the spool in the background"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self):
+        """Stop the worker; a job cut off mid-flight is recovered on next start"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def recover(self):
+        try:
+            recovered = self.queue.recover()
+        except OSError as e:
+            print(f"⚠️ Could not recover ingestion jobs: {e}", file=sys.stderr)
+            return
+        if recovered:
+            print(f"♻️ Re-queued {recovered} interrupted ingestion job(s)", file=sys.stderr)
+
+    def requeue_failed(self):
+        try:
+            requeued = self.queue.requeue_failed()
+        except OSError as e:
+            print(f"⚠️ Could not re-queue failed ingestion jobs: {e}", file=sys.stderr)
+            return
+        if requeued:
+            print(f"♻️ Re-queued {requeued} failed ingestion job(s)", file=sys.stderr)
+
+    async def _heartbeat(self, job: Dict[str, Any]):
+        """Keep a job's lease alive while it is being ingested"""
+        while True:
+            await asyncio.sleep(self.queue.lease_timeout / 4)
+            if not self.queue.heartbeat(job):
+                print(f"⚠️ Lost the lease on ingestion job {job['id']}", file=sys.stderr)
+                return
+
+    async def run(self):
+        self.recover()
+        self.requeue_failed()
+        recovered_at = time.monotonic()
+
+        while True:
+            # Jobs of a worker that died while this one runs are picked up too
+            if time.monotonic() - recovered_at > self.queue.lease_timeout / 2:
+                self.recover()
+                recovered_at = time.monotonic()
+            # Clear before claiming so a notify() during the scan is not lost
+            self._wakeup.clear()
+            try:
+                job = self.queue.claim()
+            except OSError as e:
+                print(f"⚠️ Could not read the ingestion spool: {e}", file=sys.stderr)
+                job = None
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            job["attempts"] += 1
+            heartbeat = asyncio.create_task(self._heartbeat(job))
+            error = None
+            try:
+                await self.ingest(job["payload"])
+            except Exception as e:
+                error = e
+                print(f"❌ Ingestion job {job['id']} failed (attempt {job['attempts']}): {e}", file=sys.stderr)
+            finally:
+                heartbeat.cancel()
+
+            # Bookkeeping errors must not end the worker; a job left in
+            # processing/ is re-queued once its lease expires
+            try:
+                if error is not None:
+                    self.queue.retry(job, str(error), self.max_attempts, self.backoff, self.max_backoff)
+                else:
+                    self.queue.complete(job)
+                    if self.on_complete:
+                        self.on_complete(job)
+            except Exception as e:
+                print(f"⚠️ Could not record the outcome of ingestion job {job['id']}: {e}", file=sys.stderr)
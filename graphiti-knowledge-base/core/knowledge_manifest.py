@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Knowledge Manifest for Toastmasters AI Agent
+Split layout of data/toastmasters_knowledge.json: a small manifest with each
+episode's metadata, preview and byte range, plus one file of concatenated
+bodies that is memory-mapped and sliced on demand. Listing and single-episode
+views read the manifest and only the bytes of the bodies they show.
+"""
+
+import json
+import mmap
+import os
+from typing import Any, Dict, List, Optional
+
+from knowledge_store import source_signature
+
+PREVIEW_CHARS = 100
+MANIFEST_VERSION = 1
+
+
+def manifest_paths(json_path: str) -> Dict[str, str]:
+    stem = os.path.splitext(json_path)[0]
+    return {"manifest": f"{stem}.manifest.json", "bodies": f"{stem}.bodies"}
+
+
+def build_manifest(json_path: str) -> Dict[str, Any]:
+    """Write the manifest and bodies file for a JSON knowledge base and return the manifest
+
+    The bodies file is written first and the manifest last, each through a
+    temporary file, so a reader never sees a manifest pointing at missing bytes.
+    """
+    paths = manifest_paths(json_path)
+    signature = source_signature(json_path)
+    with open(json_path, 'r', encoding='utf-8') as f:
+        knowledge_base = json.load(f)
+
+    entries: List[Dict[str, Any]] = []
+    offset = 0
+    tmp_bodies = f"{paths['bodies']}.tmp"
+    with open(tmp_bodies, 'wb') as bodies:
+        for position, episode in enumerate(knowledge_base.get("episodes", [])):
+            body = episode.get("content", "").encode("utf-8")
+            bodies.write(body)
+            entries.append({
+                "position": position,
+                "id": episode.get("id"),
+                "title": episode.get("title", ""),
+                "category": episode.get("category", ""),
+                "entities": episode.get("entities", []),
+                "created": episode.get("created", ""),
+                "preview": episode.get("content", "").lstrip()[:PREVIEW_CHARS],
+                "offset": offset,
+                "length": len(body)
+            })
+            offset += len(body)
+    os.replace(tmp_bodies, paths["bodies"])
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "source": signature,
+        "bodies_size": offset,
+        "metadata": knowledge_base.get("metadata", {}),
+        "episodes": entries
+    }
+    tmp_manifest = f"{paths['manifest']}.tmp"
+    with open(tmp_manifest, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp_manifest, paths["manifest"])
+    return manifest
+
+
+class LazyKnowledgeBase:
+    """Episode metadata from the manifest, with bodies read from the mapped bodies file"""
+
+    def __init__(self, manifest: Dict[str, Any], bodies_path: str):
+        self.metadata: Dict[str, Any] = manifest["metadata"]
+        self.episodes: List[Dict[str, Any]] = manifest["episodes"]
+        self.bodies_path = bodies_path
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+
+    def body(self, position: int) -> str:
+        """Content of one episode, decoded from just its byte range"""
+        entry = self.episodes[position]
+        if entry["length"] == 0:
+            return ""
+        if self._map is None:
+            self._file = open(self.bodies_path, 'rb')
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[entry["offset"]:entry["offset"] + entry["length"]].decode("utf-8")
+
+    def episode(self, position: int) -> Optional[Dict[str, Any]]:
+        """Full episode (metadata plus content), or None if out of range"""
+        if not 0 <= position < len(self.episodes):
+            return None
+        return {**self.episodes[position], "content": self.body(position)}
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
+
+
+def load_manifest(json_path: str) -> LazyKnowledgeBase:
+    """Open the split layout for a JSON knowledge base, (re)building it if missing or stale"""
+    paths = manifest_paths(json_path)
+    manifest = None
+    if os.path.exists(paths["manifest"]) and os.path.exists(paths["bodies"]):
+        with open(paths["manifest"], 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        current = (
+            manifest.get("version") == MANIFEST_VERSION
+            and manifest.get("source") == source_signature(json_path)
+            and manifest.get("bodies_size") == os.path.getsize(paths["bodies"])
+        )
+        if not current:
+            manifest = None
+    if manifest is None:
+        manifest = build_manifest(json_path)
+    return LazyKnowledgeBase(manifest, paths["bodies"])
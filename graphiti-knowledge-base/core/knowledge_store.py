@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Knowledge Store for Toastmasters AI Agent
+Optional SQLite copy of data/toastmasters_knowledge.json with an FTS5 index
+over title, content, entities and category, so the viewer scripts can list,
+fetch and search episodes without parsing the whole JSON file.
+
+Usage: python knowledge_store.py import [knowledge.json] [knowledge.sqlite3]
+"""
+
+import json
+import os
+import sqlite3
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from local_knowledge import tokenize
+
+DEFAULT_JSON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "toastmasters_knowledge.json")
+# bm25() column weights, in FTS column order: title, content, entities, category
+FTS_WEIGHTS = (3.0, 1.0, 2.0, 0.5)
+PREVIEW_CHARS = 100
+
+SCHEMA = """
+CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE episodes (
+    position INTEGER PRIMARY KEY,
+    id TEXT,
+    title TEXT NOT NULL,
+    category TEXT NOT NULL,
+    entities TEXT NOT NULL,
+    created TEXT NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE INDEX episodes_id ON episodes (id);
+CREATE INDEX episodes_category ON episodes (category);
+CREATE VIRTUAL TABLE episodes_fts USING fts5(title, content, entities, category, tokenize='porter unicode61');
+"""
+
+
+def default_db_path(json_path: str) -> str:
+    """SQLite file next to the JSON knowledge base, unless GRAPHITI_KNOWLEDGE_DB is set"""
+    return os.getenv("GRAPHITI_KNOWLEDGE_DB") or os.path.splitext(json_path)[0] + ".sqlite3"
+
+
+def source_signature(json_path: str) -> str:
+    stat = os.stat(json_path)
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def import_json(json_path: str, db_path: str) -> int:
+    """Build the SQLite store from the JSON knowledge base, replacing it atomically"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        knowledge_base = json.load(f)
+
+    tmp_path = f"{db_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    db = sqlite3.connect(tmp_path)
+    try:
+        db.executescript(SCHEMA)
+        metadata = {key: json.dumps(value) for key, value in knowledge_base.get("metadata", {}).items()}
+        metadata["_source"] = json.dumps(source_signature(json_path))
+        db.executemany("INSERT INTO metadata VALUES (?, ?)", metadata.items())
+        for position, episode in enumerate(knowledge_base.get("episodes", [])):
+            title = episode.get("title", "")
+            category = episode.get("category", "")
+            content = episode.get("content", "")
+            entities = episode.get("entities", [])
+            db.execute(
+                "INSERT INTO episodes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (position, episode.get("id"), title, category, json.dumps(entities), episode.get("created", ""), content)
+            )
+            db.execute(
+                "INSERT INTO episodes_fts (rowid, title, content, entities, category) VALUES (?, ?, ?, ?, ?)",
+                (position, title, content, " ".join(entities), category)
+            )
+        db.commit()
+    finally:
+        db.close()
+    os.replace(tmp_path, db_path)
+    return len(knowledge_base.get("episodes", []))
+
+
+class KnowledgeStore:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._db = sqlite3.connect(db_path)
+        self._db.row_factory = sqlite3.Row
+
+    @staticmethod
+    def _episode(row: sqlite3.Row) -> Dict[str, Any]:
+        episode = dict(row)
+        if "entities" in episode:
+            episode["entities"] = json.loads(episode["entities"])
+        return episode
+
+    def metadata(self) -> Dict[str, Any]:
+        return {
+            key: json.loads(value)
+            for key, value in self._db.execute("SELECT key, value FROM metadata")
+            if not key.startswith("_")
+        }
+
+    def count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM episodes").fetchone()[0]
+
+    def list_episodes(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Episode metadata with a short content preview, without full bodies"""
+        sql = (f"SELECT position, id, title, category, entities, created, "
+               f"substr(ltrim(content, char(9, 10, 13, 32)), 1, {PREVIEW_CHARS}) AS preview FROM episodes")
+        rows = self._db.execute(sql + " WHERE category = ? ORDER BY position", (category,)) if category \
+            else self._db.execute(sql + " ORDER BY position")
+        return [self._episode(row) for row in rows]
+
+    def get_episode(self, position: int) -> Optional[Dict[str, Any]]:
+        row = self._db.execute("SELECT * FROM episodes WHERE position = ?", (position,)).fetchone()
+        return self._episode(row) if row else None
+
+    def episodes(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Full episodes in file order, optionally for one category"""
+        rows = self._db.execute("SELECT * FROM episodes WHERE category = ? ORDER BY position", (category,)) if category \
+            else self._db.execute("SELECT * FROM episodes ORDER BY position")
+        return [self._episode(row) for row in rows]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[Dict[str, Any], float]]:
+        """Full-text search ranked by FTS5 bm25 with title/entity weights, best first"""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        # Quote every term so user input never reaches FTS query syntax
+        match = " OR ".join(f'"{term}"' for term in dict.fromkeys(terms))
+        weights = ", ".join(str(weight) for weight in FTS_WEIGHTS)
+        rows = self._db.execute(
+            f"SELECT e.*, bm25(episodes_fts, {weights}) AS bm25_score "
+            f"FROM episodes_fts JOIN episodes e ON e.position = episodes_fts.rowid "
+            f"WHERE episodes_fts MATCH ? ORDER BY bm25_score LIMIT ?",
+            (match, -1 if limit is None else limit)
+        )
+        results = []
+        for row in rows:
+            episode = self._episode(row)
+            # bm25() is lower-is-better; flip it so higher means more relevant
+            results.append((episode, -episode.pop("bm25_score")))
+        return results
+
+    def close(self):
+        self._db.close()
+
+
+def open_store(json_path: str) -> Optional[KnowledgeStore]:
+    """Open the SQLite store for a JSON knowledge base if it exists and is current
+
+    Returns None (so callers fall back to the JSON file) when the store has
+    not been imported, or when the JSON file changed after the last import.
+    """
+    db_path = default_db_path(json_path)
+    if not os.path.exists(db_path):
+        return None
+    store = KnowledgeStore(db_path)
+    if os.path.exists(json_path):
+        row = store._db.execute("SELECT value FROM metadata WHERE key = '_source'").fetchone()
+        if row is None or json.loads(row[0]) != source_signature(json_path):
+            print(f"⚠️ {db_path} is older than {json_path}; re-run: python core/knowledge_store.py import")
+            store.close()
+            return None
+    return store
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] != "import":
+        print("Usage: python knowledge_store.py import [knowledge.json] [knowledge.sqlite3]")
+        return
+    json_path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_JSON_PATH
+    db_path = sys.argv[3] if len(sys.argv) > 3 else default_db_path(json_path)
+    count = import_json(json_path, db_path)
+    print(f"✅ Imported {count} episodes into {db_path}")
+
+
+if __name__ == "__main__":
+    main()
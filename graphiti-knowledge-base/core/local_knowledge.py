@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Local Knowledge Search for Toastmasters AI Agent
+BM25 keyword search over the episodes shipped in
+data/toastmasters_knowledge.json, used by the knowledge base viewer and by
+the MCP server as a degraded fallback while FalkorDB or the OpenAI API is
+unavailable. The BM25 index is saved next to the knowledge base and reused
+while the source file is unchanged.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import textwrap
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+TOKEN = re.compile(r"[a-z0-9]+")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in", "is",
+    "it", "of", "on", "or", "the", "to", "was", "what", "when", "which", "with"
+}
+# Matches in an episode's title or entities count more than matches in its body
+FIELD_BOOSTS = {"title": 3.0, "entities": 2.0, "content": 1.0}
+BM25_K1 = 1.2
+BM25_B = 0.75
+INDEX_VERSION = 1
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in TOKEN.findall(text.lower()) if t not in STOPWORDS]
+
+
+def episode_fields(episode: Dict[str, Any]) -> Dict[str, str]:
+    return {
+        "title": episode.get("title", ""),
+        "entities": " ".join(episode.get("entities", [])),
+        "content": episode.get("content", "")
+    }
+
+
+class BM25Index:
+    """Inverted index over episodes with field-boosted BM25 scoring
+
+    Each field's term counts are multiplied by its boost and summed into one
+    weighted term frequency per episode (and likewise for document length),
+    so a title hit outweighs the same word in the body. Searching touches
+    only the postings of the query terms.
+    """
+
+    def __init__(self, episodes: List[Dict[str, Any]], boosts: Optional[Dict[str, float]] = None):
+        self.boosts = boosts or FIELD_BOOSTS
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        self.lengths: List[float] = []
+        for i, episode in enumerate(episodes):
+            weighted: Counter = Counter()
+            for field, text in episode_fields(episode).items():
+                boost = self.boosts.get(field, 1.0)
+                for term, count in Counter(tokenize(text)).items():
+                    weighted[term] += boost * count
+            for term, tf in weighted.items():
+                self.postings.setdefault(term, []).append((i, tf))
+            self.lengths.append(sum(weighted.values()))
+        self._finish()
+
+    def _finish(self):
+        self.size = len(self.lengths)
+        self.average_length = sum(self.lengths) / self.size if self.size else 0.0
+
+    def state(self) -> Dict[str, Any]:
+        """JSON-serializable form of the index, restored by from_state()"""
+        return {"boosts": self.boosts, "postings": self.postings, "lengths": self.lengths}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "BM25Index":
+        # Postings come back as [index, tf] lists, which unpack like the tuples
+        index = cls.__new__(cls)
+        index.boosts = state["boosts"]
+        index.postings = state["postings"]
+        index.lengths = state["lengths"]
+        index._finish()
+        return index
+
+    def idf(self, term: str) -> float:
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (self.size - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, limit: Optional[int] = 10) -> List[Tuple[int, float]]:
+        """Return (episode index, score) pairs for the best matches, highest first"""
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            matches = self.postings.get(term)
+            if not matches:
+                continue
+            idf = self.idf(term)
+            for i, tf in matches:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[i] / self.average_length)
+                scores[i] = scores.get(i, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+        if limit is None:
+            return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+
+def index_path(json_path: str) -> str:
+    return os.path.splitext(json_path)[0] + ".bm25.json"
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def save_index(index: BM25Index, path: str, source: Dict[str, Any]):
+    """Write the index through a temporary file so readers never see a partial one"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": INDEX_VERSION, "source": source, **index.state()}, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def load_index(json_path: str, episodes: Optional[List[Dict[str, Any]]] = None,
+               boosts: Optional[Dict[str, float]] = None) -> BM25Index:
+    """BM25 index for a JSON knowledge base, reused from disk when the source is unchanged
+
+    A saved index is trusted when the source's mtime and size match; if only
+    the mtime moved, the SHA-256 of the file decides. Otherwise the index is
+    rebuilt (from `episodes` if the caller already parsed them) and saved.
+    """
+    boosts = boosts or FIELD_BOOSTS
+    path = index_path(json_path)
+    stat = os.stat(json_path)
+    source = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    saved = None
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            saved = None
+    if saved and saved.get("version") == INDEX_VERSION and saved.get("boosts") == boosts:
+        stored = saved.get("source", {})
+        if stored.get("mtime_ns") == source["mtime_ns"] and stored.get("size") == source["size"]:
+            return BM25Index.from_state(saved)
+        source["sha256"] = file_sha256(json_path)
+        if stored.get("sha256") == source["sha256"]:
+            index = BM25Index.from_state(saved)
+            try:
+                save_index(index, path, source)
+            except OSError:
+                pass
+            return index
+    if episodes is None:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            episodes = json.load(f).get("episodes", [])
+    index = BM25Index(episodes, boosts)
+    source.setdefault("sha256", file_sha256(json_path))
+    try:
+        save_index(index, path, source)
+    except OSError:
+        # Read-only data directory: search still works, it just rebuilds next time
+        pass
+    return index
+
+
+class LocalSearchResult:
+    """Search hit shaped like a Graphiti result (content, entities), flagged as degraded"""
+
+    degraded = True
+
+    def __init__(self, episode: Dict[str, Any], content: str, score: float):
+        self.uuid = episode.get("id", "")
+        self.title = episode.get("title", "")
+        self.category = episode.get("category", "")
+        self.entities = episode.get("entities", [])
+        self.content = content
+        self.score = score
+
+
+class LocalKnowledgeIndex:
+    def __init__(self, path: str):
+        self.path = path
+        self.episodes: List[Dict[str, Any]] = []
+        self.contents: List[str] = []
+        self.index: Optional[BM25Index] = None
+        self._mtime: Optional[float] = None
+
+    def _load(self):
+        """(Re)build the index when the knowledge file has changed"""
+        mtime = os.path.getmtime(self.path)
+        if mtime == self._mtime:
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            episodes = json.load(f).get("episodes", [])
+        self.episodes = episodes
+        self.contents = [textwrap.dedent(episode.get("content", "")).strip() for episode in episodes]
+        self.index = load_index(self.path, episodes)
+        self._mtime = mtime
+
+    def search(self, query: str, limit: int = 5) -> List[LocalSearchResult]:
+        """Rank episodes by BM25 over title, entities and content"""
+        self._load()
+        return [
+            LocalSearchResult(self.episodes[i], self.contents[i], score)
+            for i, score in self.index.search(query, limit)
+        ]
@@ -4,10 +4,13 @@ Graphiti MCP Server for Cursor Integration
 This server provides AI agents with access to the Toastmasters project knowledge base.
 """
 
+import argparse
 import asyncio
+import contextvars
 import json
 import os
 import sys
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -18,7 +21,13 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
-from config import setup_environment
+from config import GRAPHITI_CONFIG, setup_environment
+from ingestion_queue import IngestionQueue, IngestionWorker
+from rate_limiter import scheduled_add_episode
+from query_cache import QueryCache, ResultSetStore, normalize_query
+from server_metrics import ServerMetrics
+from local_knowledge import LocalKnowledgeIndex
+from response_format import RESPONSE_FORMAT_PROPERTIES, format_results_json, result_content
 
 try:
     from mcp.server import Server
@@ -32,35 +41,325 @@ try:
         TextContent,
     )
     from graphiti_core import Graphiti
-    from graphiti_core.driver.falkordb_driver import FalkorDriver
+    from graphiti_client import create_graphiti
     MCP_AVAILABLE = True
 except ImportError as e:
     print(f"❌ Required packages not installed: {e}")
     print("Install with: pip install mcp graphiti-core[falkordb]")
     MCP_AVAILABLE = False
 
+# Errors meaning the knowledge graph is unreachable, as opposed to a bug; only
+# these switch reads to the local snapshot
+BACKEND_UNAVAILABLE_ERRORS: tuple = (OSError, asyncio.TimeoutError)
+try:
+    from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+    BACKEND_UNAVAILABLE_ERRORS += (RedisConnectionError, RedisTimeoutError)
+except ImportError:
+    pass
+try:
+    from openai import APIConnectionError
+    BACKEND_UNAVAILABLE_ERRORS += (APIConnectionError,)
+except ImportError:
+    pass
+
+# Fixed queries behind the overview, preferences and recent-changes tools
+OVERVIEW_QUERIES = {
+    "all": "Toastmasters project architecture components React TypeScript Firebase",
+    "preferences": "user preferences UI guidelines git workflow",
+    "bugs": "bug fixes solutions month selection logic",
+    "business_logic": "Toastmasters business logic meeting structure member management",
+    "technical": "technical implementation data models Firebase collections"
+}
+PREFERENCES_QUERY = "user preferences UI guidelines git workflow"
+RECENT_CHANGES_QUERY = "bug fixes solutions recent changes"
+
+# Deterministic tool reads materialized into a precomputed store: key -> (query, limit)
+CANNED_QUERIES = {f"overview:{aspect}": (query, 3) for aspect, query in OVERVIEW_QUERIES.items()}
+CANNED_QUERIES["preferences"] = (PREFERENCES_QUERY, 2)
+
+# Embedding time spent inside the current backend search task, so graph query
+# time can be reported as the remainder
+_embedding_seconds: contextvars.ContextVar[Optional[List[float]]] = contextvars.ContextVar(
+    "embedding_seconds", default=None
+)
+
+# Why the current tool call was answered from the local snapshot, if it was
+_degraded_reasons: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    "degraded_reasons", default=None
+)
+
+def is_degraded(results: List[Any]) -> bool:
+    """Whether results came from the local snapshot rather than the knowledge graph"""
+    return any(getattr(result, "degraded", False) for result in results)
+
 class GraphitiMCPServer:
     def __init__(self):
         self.server = Server("graphiti-knowledge-base")
         self.graphiti = None
+        self._init_lock = asyncio.Lock()
+        self.readiness: Dict[str, Any] = {"state": "not_started", "steps": {}, "error": None}
+        self.metrics = ServerMetrics()
+        # Fallback search over the shipped JSON snapshot while FalkorDB/OpenAI are down
+        self.local_index = LocalKnowledgeIndex(GRAPHITI_CONFIG["local_knowledge_path"])
+        self.backend_error: Optional[str] = None
+        self._backend_verified = False
+        self._backend_retry_at = 0.0
+        self.query_cache = QueryCache(
+            max_entries=GRAPHITI_CONFIG["query_cache_size"],
+            ttl_seconds=GRAPHITI_CONFIG["query_cache_ttl"]
+        )
+        # search_knowledge fetches a deeper result set once and pages through it
+        self.result_sets = ResultSetStore(ttl_seconds=GRAPHITI_CONFIG["search_cursor_ttl"])
+        # Identical concurrent searches share one in-flight task, and the
+        # semaphore caps how many distinct searches hit FalkorDB at once
+        self._inflight_searches: Dict[Any, asyncio.Task] = {}
+        self._search_slots = asyncio.Semaphore(GRAPHITI_CONFIG["mcp_max_concurrent_searches"])
+        self.coalesced_searches = 0
+        # Canned overview/preferences answers, refreshed in the background after writes
+        self.canned_answers: Dict[str, Dict[str, Any]] = {}
+        self._canned_refresh: Optional[asyncio.Task] = None
+        self._canned_dirty = False
+        # add_knowledge spools to disk and returns; the worker does the slow extraction
+        self.ingestion_queue = IngestionQueue(
+            GRAPHITI_CONFIG["spool_dir"],
+            lease_timeout=GRAPHITI_CONFIG["spool_lease_timeout"]
+        )
+        self.ingestion_worker = IngestionWorker(
+            self.ingestion_queue,
+            self.ingest_spooled_knowledge,
+            max_attempts=GRAPHITI_CONFIG["spool_max_attempts"],
+            max_backoff=GRAPHITI_CONFIG["spool_max_backoff"],
+            on_complete=self.on_knowledge_added
+        )
         self.setup_tools()
     
+    async def ensure_graphiti(self):
+        """Initialize Graphiti once, even when called concurrently"""
+        async with self._init_lock:
+            if not self.graphiti:
+                await self.initialize_graphiti()
+    
     async def initialize_graphiti(self):
         """Initialize Graphiti connection"""
         try:
             # Set up environment from configuration
             setup_environment()
             
-            driver = FalkorDriver(
-                host=os.getenv("FALKORDB_HOST", "localhost"),
-                port=int(os.getenv("FALKORDB_PORT", 6379))
-            )
-            self.graphiti = Graphiti(graph_driver=driver)
-            print("✅ Graphiti MCP Server initialized (local mode)")
+            with self.metrics.stage("connect"):
+                self.graphiti = create_graphiti()
+            self.instrument_embedder()
+            print("✅ Graphiti MCP Server initialized (local mode)", file=sys.stderr)
         except Exception as e:
-            print(f"❌ Failed to initialize Graphiti: {e}")
+            print(f"❌ Failed to initialize Graphiti: {e}", file=sys.stderr)
             raise
     
+    def instrument_embedder(self):
+        """Time the embedder calls Graphiti makes while searching"""
+        embedder = getattr(self.graphiti, "embedder", None)
+        if embedder is None or not hasattr(embedder, "create"):
+            return
+        create = embedder.create
+        metrics = self.metrics
+        
+        async def timed_create(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await create(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - started
+                metrics.observe_stage("embedding", elapsed)
+                spent = _embedding_seconds.get()
+                if spent is not None:
+                    spent.append(elapsed)
+        
+        embedder.create = timed_create
+    
+    async def warm_up(self, run_searches: bool = True):
+        """Connect, verify FalkorDB, build indices and prime caches before serving
+        
+        Each step's duration is recorded in self.readiness. A failed warm-up
+        leaves the server usable; tools then connect lazily on first call.
+        """
+        self.readiness = {"state": "warming", "steps": {}, "error": None}
+        
+        async def step(name, action):
+            started = time.perf_counter()
+            await action()
+            self.readiness["steps"][name] = round((time.perf_counter() - started) * 1000, 1)
+        
+        async def warm_searches():
+            await asyncio.gather(self.refresh_canned_answers(), self.cached_search(RECENT_CHANGES_QUERY, 5))
+        
+        try:
+            await step("connect", self.ensure_graphiti)
+            await step("verify_falkordb", lambda: self.graphiti.driver.execute_query("RETURN 1"))
+            await step("build_indices", self.graphiti.build_indices_and_constraints)
+            if run_searches:
+                await step("warm_searches", warm_searches)
+            self.readiness["state"] = "ready"
+            total = sum(self.readiness["steps"].values())
+            print(f"✅ Graphiti MCP Server ready ({total:.0f} ms warm-up)", file=sys.stderr)
+        except Exception as e:
+            self.readiness["state"] = "failed"
+            self.readiness["error"] = str(e)
+            print(f"⚠️ Warm-up failed, tools will connect lazily: {e}", file=sys.stderr)
+    
+    async def probe_backend(self) -> Optional[str]:
+        """Return why the knowledge graph cannot be used, or None if it looks reachable"""
+        if not GRAPHITI_CONFIG["openai_api_key"]:
+            return "OPENAI_API_KEY is not set"
+        host, port = GRAPHITI_CONFIG["falkordb_host"], GRAPHITI_CONFIG["falkordb_port"]
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), GRAPHITI_CONFIG["backend_probe_timeout"]
+            )
+            writer.close()
+        except (OSError, asyncio.TimeoutError) as e:
+            return f"FalkorDB unreachable at {host}:{port} ({e or 'timed out'})"
+        return None
+    
+    def mark_backend_down(self, reason: str):
+        """Serve local results until the backend is probed again after the retry interval"""
+        if self.backend_error is None:
+            print(f"⚠️ Knowledge graph unavailable, using local knowledge: {reason}", file=sys.stderr)
+        self.backend_error = reason
+        self._backend_verified = False
+        self._backend_retry_at = time.monotonic() + GRAPHITI_CONFIG["backend_retry_interval"]
+    
+    async def backend_available(self) -> bool:
+        """Whether reads should go to Graphiti, probing at most once per retry interval"""
+        if not GRAPHITI_CONFIG["offline_fallback"] or self._backend_verified:
+            return True
+        if time.monotonic() < self._backend_retry_at:
+            return False
+        reason = await self.probe_backend()
+        if reason:
+            self.mark_backend_down(reason)
+            return False
+        if self.backend_error:
+            print("✅ Knowledge graph reachable again", file=sys.stderr)
+        self.backend_error = None
+        self._backend_verified = True
+        return True
+    
+    def note_degraded(self):
+        """Flag the current tool call as answered from the local snapshot"""
+        reasons = _degraded_reasons.get()
+        if reasons is not None:
+            reasons.append(self.backend_error or "knowledge graph unavailable")
+    
+    def local_search(self, query: str, limit: int) -> List[Any]:
+        """Search the local snapshot instead of the knowledge graph"""
+        self.note_degraded()
+        return self.local_index.search(query, limit)
+    
+    async def cached_search(self, query: str, limit: int) -> List[Any]:
+        """Search the knowledge base, serving repeated queries from the cache"""
+        key = (normalize_query(query), limit)
+        hit, results = self.query_cache.get(key)
+        if hit:
+            return results
+        
+        if not await self.backend_available():
+            return self.local_search(query, limit)
+        
+        # Keyed by generation too, so a search started after a write never
+        # joins one that may return pre-write results
+        generation = self.query_cache.generation
+        flight_key = (key, generation)
+        task = self._inflight_searches.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(self._backend_search(query, limit, key, generation))
+            self._inflight_searches[flight_key] = task
+            task.add_done_callback(lambda _: self._inflight_searches.pop(flight_key, None))
+        else:
+            self.coalesced_searches += 1
+        # Shielded so one caller being cancelled does not cancel the shared search
+        try:
+            return await asyncio.shield(task)
+        except BACKEND_UNAVAILABLE_ERRORS as e:
+            if not GRAPHITI_CONFIG["offline_fallback"]:
+                raise
+            self.mark_backend_down(f"search failed: {e}")
+            return self.local_search(query, limit)
+    
+    def on_knowledge_added(self, job: Dict[str, Any]):
+        """Drop cached searches and re-materialize canned answers after a write"""
+        self.query_cache.invalidate()
+        self.schedule_canned_refresh()
+    
+    def schedule_canned_refresh(self):
+        """Re-materialize canned answers in the background (at most one refresh at a time)"""
+        if self._canned_refresh and not self._canned_refresh.done():
+            # The running refresh goes round again once it finishes
+            self._canned_dirty = True
+            return
+        self._canned_refresh = asyncio.ensure_future(self._background_canned_refresh())
+    
+    async def _background_canned_refresh(self):
+        try:
+            await self.refresh_canned_answers()
+        except Exception as e:
+            print(f"⚠️ Failed to refresh canned answers: {e}", file=sys.stderr)
+    
+    async def refresh_canned_answers(self):
+        """Recompute every canned answer, repeating if another write lands meanwhile"""
+        await self.ensure_graphiti()
+        while True:
+            self._canned_dirty = False
+            generation = self.query_cache.generation
+            results = await asyncio.gather(*(
+                self.cached_search(query, limit) for query, limit in CANNED_QUERIES.values()
+            ))
+            for key, key_results in zip(CANNED_QUERIES, results):
+                if not is_degraded(key_results):
+                    self.store_canned_answer(key, key_results)
+            if not self._canned_dirty and generation == self.query_cache.generation:
+                return
+    
+    def store_canned_answer(self, key: str, results: List[Any]):
+        # Writes from other processes (setup scripts, other servers) never reach
+        # on_knowledge_added, so answers also expire with the query cache TTL
+        self.canned_answers[key] = {
+            "results": results,
+            "refreshed_at": datetime.now().isoformat(),
+            "expires_at": time.monotonic() + GRAPHITI_CONFIG["query_cache_ttl"]
+        }
+    
+    async def canned_answer(self, key: str) -> List[Any]:
+        """Results for a canned query, materializing it on first use
+        
+        An expired answer is still returned while a background refresh
+        replaces it.
+        """
+        answer = self.canned_answers.get(key)
+        if answer is not None:
+            if time.monotonic() >= answer["expires_at"]:
+                self.schedule_canned_refresh()
+            return answer["results"]
+        
+        query, limit = CANNED_QUERIES[key]
+        generation = self.query_cache.generation
+        results = await self.cached_search(query, limit)
+        # A write during the search means a refresh will store newer results
+        if generation == self.query_cache.generation and not is_degraded(results):
+            self.store_canned_answer(key, results)
+        return results
+    
+    async def _backend_search(self, query: str, limit: int, key: Any, generation: int) -> List[Any]:
+        """Run one Graphiti search under the concurrency cap and cache the result"""
+        async with self._search_slots:
+            # Runs in its own task, so this only collects this search's embedding time
+            spent = []
+            _embedding_seconds.set(spent)
+            started = time.perf_counter()
+            results = await self.graphiti.search(query, num_results=limit)
+            elapsed = time.perf_counter() - started
+        self.metrics.observe_stage("search", elapsed)
+        self.metrics.observe_stage("graph_query", max(0.0, elapsed - sum(spent)))
+        self.query_cache.put(key, results, generation)
+        return results
+    
     def setup_tools(self):
         """Set up MCP tools for AI agent interaction"""
         
@@ -82,7 +381,12 @@ class GraphitiMCPServer:
                                 "type": "integer",
                                 "description": "Maximum number of results to return",
                                 "default": 5
-                            }
+                            },
+                            "cursor": {
+                                "type": "string",
+                                "description": "next_cursor from a previous search_knowledge call, to get the next page of that search"
+                            },
+                            **RESPONSE_FORMAT_PROPERTIES
                         },
                         "required": ["query"]
                     }
@@ -106,6 +410,44 @@ class GraphitiMCPServer:
                         "required": ["content", "entities"]
                     }
                 ),
+                Tool(
+                    name="get_ingestion_status",
+                    description="Check whether knowledge queued by add_knowledge has been ingested",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "job_id": {
+                                "type": "string",
+                                "description": "Job id returned by add_knowledge"
+                            }
+                        },
+                        "required": ["job_id"]
+                    }
+                ),
+                Tool(
+                    name="get_server_status",
+                    description="Get server readiness, warm-up timings and ingestion queue depth",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {}
+                    }
+                ),
+                Tool(
+                    name="get_server_stats",
+                    description="Get per-tool latency percentiles, error counts and backend stage timings",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {}
+                    }
+                ),
+                Tool(
+                    name="get_cache_stats",
+                    description="Get hit/miss counters for the search result cache",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {}
+                    }
+                ),
                 Tool(
                     name="get_project_overview",
                     description="Get a comprehensive overview of the Toastmasters project",
@@ -116,7 +458,8 @@ class GraphitiMCPServer:
                                 "type": "string",
                                 "description": "Specific aspect to focus on (architecture, preferences, bugs, business_logic, technical)",
                                 "default": "all"
-                            }
+                            },
+                            **RESPONSE_FORMAT_PROPERTIES
                         }
                     }
                 ),
@@ -125,7 +468,9 @@ class GraphitiMCPServer:
                     description="Get user preferences and guidelines for the project",
                     inputSchema={
                         "type": "object",
-                        "properties": {}
+                        "properties": {
+                            **RESPONSE_FORMAT_PROPERTIES
+                        }
                     }
                 ),
                 Tool(
@@ -138,7 +483,8 @@ class GraphitiMCPServer:
                                 "type": "integer",
                                 "description": "Number of recent changes to retrieve",
                                 "default": 5
-                            }
+                            },
+                            **RESPONSE_FORMAT_PROPERTIES
                         }
                     }
                 )
@@ -147,129 +493,340 @@ class GraphitiMCPServer:
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
             """Handle tool calls from AI agents"""
-            try:
-                if not self.graphiti:
-                    await self.initialize_graphiti()
-                
-                if name == "search_knowledge":
-                    return await self.handle_search_knowledge(arguments)
-                elif name == "add_knowledge":
-                    return await self.handle_add_knowledge(arguments)
-                elif name == "get_project_overview":
-                    return await self.handle_get_project_overview(arguments)
-                elif name == "get_user_preferences":
-                    return await self.handle_get_user_preferences(arguments)
-                elif name == "get_recent_changes":
-                    return await self.handle_get_recent_changes(arguments)
-                else:
-                    return CallToolResult(
-                        content=[TextContent(type="text", text=f"Unknown tool: {name}")]
-                    )
-            except Exception as e:
+            started = time.perf_counter()
+            result = await self.dispatch_tool(name, arguments)
+            self.metrics.observe_tool(name, time.perf_counter() - started, error=getattr(result, "isError", False))
+            return result
+    
+    async def dispatch_tool(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        """Route a tool call to its handler, marking answers served from local knowledge"""
+        reasons: List[str] = []
+        _degraded_reasons.set(reasons)
+        result = await self._dispatch_tool(name, arguments)
+        # JSON answers carry the reason in their "degraded" key instead
+        if reasons and result.content and arguments.get("format") != "json":
+            notice = (
+                f"⚠️ DEGRADED: knowledge graph unavailable ({reasons[0]}). "
+                f"Results come from the local snapshot {os.path.basename(self.local_index.path)} "
+                "and may be incomplete.\n\n"
+            )
+            result.content[0].text = notice + result.content[0].text
+        return result
+    
+    async def _dispatch_tool(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        try:
+            # Spool and stats operations never wait on the Graphiti connection
+            if name == "add_knowledge":
+                return await self.handle_add_knowledge(arguments)
+            elif name == "get_ingestion_status":
+                return await self.handle_get_ingestion_status(arguments)
+            elif name == "get_cache_stats":
+                return await self.handle_get_cache_stats(arguments)
+            elif name == "get_server_status":
+                return await self.handle_get_server_status(arguments)
+            elif name == "get_server_stats":
+                return await self.handle_get_server_stats(arguments)
+            
+            if await self.backend_available():
+                try:
+                    await self.ensure_graphiti()
+                except BACKEND_UNAVAILABLE_ERRORS as e:
+                    if not GRAPHITI_CONFIG["offline_fallback"]:
+                        raise
+                    self.mark_backend_down(f"Graphiti initialization failed: {e}")
+            
+            if name == "search_knowledge":
+                return await self.handle_search_knowledge(arguments)
+            elif name == "get_project_overview":
+                return await self.handle_get_project_overview(arguments)
+            elif name == "get_user_preferences":
+                return await self.handle_get_user_preferences(arguments)
+            elif name == "get_recent_changes":
+                return await self.handle_get_recent_changes(arguments)
+            else:
                 return CallToolResult(
-                    content=[TextContent(type="text", text=f"Error: {str(e)}")]
+                    content=[TextContent(type="text", text=f"Unknown tool: {name}")],
+                    isError=True
                 )
+        except Exception as e:
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"Error: {str(e)}")],
+                isError=True
+            )
     
     async def handle_search_knowledge(self, arguments: Dict[str, Any]) -> CallToolResult:
         """Handle knowledge search requests"""
         query = arguments.get("query", "")
         limit = arguments.get("limit", 5)
+        cursor = arguments.get("cursor")
         
         try:
-            results = await self.graphiti.search(query, limit=limit)
+            if cursor:
+                set_id, _, offset = cursor.partition(":")
+                results = self.result_sets.get(set_id)
+                if results is None or not offset.isdigit() or int(offset) >= len(results):
+                    return CallToolResult(
+                        content=[TextContent(type="text", text="Cursor expired or invalid. Run the search again without a cursor.")]
+                    )
+                offset = int(offset)
+                if is_degraded(results):
+                    self.note_degraded()
+            else:
+                # One search deep enough for several pages; later pages come from the result set
+                results = await self.cached_search(query, max(limit, GRAPHITI_CONFIG["search_result_depth"]))
+                set_id, offset = None, 0
+            
+            page = results[offset:offset + limit]
+            
+            def cursor_after(shown: int) -> Optional[str]:
+                """Cursor for the results after the first `shown` of this page"""
+                nonlocal set_id
+                if offset + shown >= len(results):
+                    return None
+                if set_id is None:
+                    set_id = self.result_sets.save(results)
+                return f"{set_id}:{offset + shown}"
+            
+            if arguments.get("format") == "json":
+                return self.json_response(page, arguments, total=len(results), offset=offset, next_cursor=cursor_after)
             
             if not results:
                 return CallToolResult(
                     content=[TextContent(type="text", text="No relevant information found.")]
                 )
             
-            response = f"Found {len(results)} relevant results:\n\n"
-            for i, result in enumerate(results, 1):
-                response += f"{i}. {result.content[:200]}...\n"
-                if hasattr(result, 'entities') and result.entities:
-                    response += f"   Entities: {', '.join(result.entities[:3])}\n"
-                response += "\n"
+            with self.metrics.stage("formatting"):
+                response = f"Found {len(results)} relevant results, showing {offset + 1}-{offset + len(page)}:\n\n"
+                for i, result in enumerate(page, offset + 1):
+                    response += f"{i}. {result_content(result)[:200]}...\n"
+                    if hasattr(result, 'entities') and result.entities:
+                        response += f"   Entities: {', '.join(result.entities[:3])}\n"
+                    response += "\n"
+            
+            next_cursor = cursor_after(len(page))
+            if next_cursor:
+                response += f"More results available. next_cursor: {next_cursor}\n"
             
             return CallToolResult(
                 content=[TextContent(type="text", text=response)]
             )
         except Exception as e:
             return CallToolResult(
-                content=[TextContent(type="text", text=f"Search failed: {str(e)}")]
+                content=[TextContent(type="text", text=f"Search failed: {str(e)}")],
+                isError=True
             )
     
+    def json_response(self, results: List[Any], arguments: Dict[str, Any], **extra: Any) -> CallToolResult:
+        """Compact JSON answer for format="json" calls, honoring fields and max_tokens"""
+        reasons = _degraded_reasons.get()
+        with self.metrics.stage("formatting"):
+            text = format_results_json(
+                results,
+                fields=arguments.get("fields"),
+                max_tokens=arguments.get("max_tokens"),
+                degraded=reasons[0] if reasons else None,
+                **extra
+            )
+        return CallToolResult(
+            content=[TextContent(type="text", text=text)]
+        )
+    
     async def handle_add_knowledge(self, arguments: Dict[str, Any]) -> CallToolResult:
-        """Handle adding new knowledge to the base"""
+        """Handle adding new knowledge to the base by spooling it for the worker"""
         content = arguments.get("content", "")
         entities = arguments.get("entities", [])
         
         try:
-            await self.graphiti.add_episode(content=content, entities=entities)
+            job_id = self.ingestion_queue.enqueue({
+                "content": content,
+                "entities": entities,
+                "submitted": datetime.now().isoformat()
+            })
+            self.ingestion_worker.notify()
             return CallToolResult(
-                content=[TextContent(type="text", text="Knowledge successfully added to the base.")]
+                content=[TextContent(type="text", text=f"Knowledge queued for ingestion (job id: {job_id}).")]
             )
         except Exception as e:
             return CallToolResult(
-                content=[TextContent(type="text", text=f"Failed to add knowledge: {str(e)}")]
+                content=[TextContent(type="text", text=f"Failed to add knowledge: {str(e)}")],
+                isError=True
             )
     
+    async def handle_get_ingestion_status(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """Report the state of a spooled add_knowledge job"""
+        job_id = arguments.get("job_id", "")
+        status = self.ingestion_queue.status(job_id)
+        
+        response = f"Job {job_id}: {status['state']}"
+        if status.get("attempts"):
+            response += f" (attempts: {status['attempts']})"
+        if status.get("last_error"):
+            response += f"\nLast error: {status['last_error']}"
+        
+        return CallToolResult(
+            content=[TextContent(type="text", text=response)]
+        )
+    
+    async def handle_get_server_status(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """Report readiness, warm-up step timings and spool depth"""
+        state = self.readiness["state"]
+        if state == "not_started":
+            state = "ready (lazy)" if self.graphiti else "lazy (connects on first call)"
+        
+        response = f"Server status: {state}\n"
+        for name, ms in self.readiness["steps"].items():
+            response += f"   {name}: {ms} ms\n"
+        if self.readiness["error"]:
+            response += f"Warm-up error: {self.readiness['error']}\n"
+        if self.backend_error:
+            response += f"Knowledge graph: unavailable ({self.backend_error}), answering from local knowledge\n"
+        if self.canned_answers:
+            oldest = min(answer["refreshed_at"] for answer in self.canned_answers.values())
+            response += f"Canned answers: {len(self.canned_answers)}/{len(CANNED_QUERIES)} materialized, oldest from {oldest}\n"
+        counts = self.ingestion_queue.counts()
+        response += f"Ingestion queue: {counts['pending']} pending, {counts['processing']} processing, {counts['failed']} failed"
+        
+        return CallToolResult(
+            content=[TextContent(type="text", text=response)]
+        )
+    
+    async def handle_get_server_stats(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """Report per-tool latency and errors plus backend stage timings"""
+        summary = self.metrics.summary()
+        response = f"Server stats (uptime {summary['uptime_seconds']:.0f}s)\n\nTools:\n"
+        for name, tool in summary["tools"].items():
+            response += (
+                f"   {name}: {tool['count']} calls, {tool['errors']} errors, "
+                f"p50 {tool['p50_ms']:.1f} ms, p95 {tool['p95_ms']:.1f} ms, max {tool['max_ms']:.1f} ms\n"
+            )
+        response += "\nBackend stages:\n"
+        for name, stage in summary["stages"].items():
+            response += (
+                f"   {name}: {stage['count']} runs, mean {stage['mean_ms']:.1f} ms, "
+                f"p95 {stage['p95_ms']:.1f} ms\n"
+            )
+        cache = self.query_cache.stats()
+        response += (
+            f"\nSearch cache: {cache['hits']} hits, {cache['misses']} misses, "
+            f"{self.coalesced_searches} coalesced"
+        )
+        return CallToolResult(
+            content=[TextContent(type="text", text=response)]
+        )
+    
+    def metrics_gauges(self) -> Dict[str, float]:
+        """Point-in-time values exported alongside the histograms"""
+        cache = self.query_cache.stats()
+        counts = self.ingestion_queue.counts()
+        return {
+            "graphiti_mcp_search_cache_hits_total": cache["hits"],
+            "graphiti_mcp_search_cache_misses_total": cache["misses"],
+            "graphiti_mcp_search_cache_entries": cache["entries"],
+            "graphiti_mcp_coalesced_searches_total": self.coalesced_searches,
+            "graphiti_mcp_spool_pending": counts["pending"],
+            "graphiti_mcp_spool_failed": counts["failed"]
+        }
+    
+    async def write_metrics_periodically(self):
+        """Write the Prometheus text file every metrics_interval seconds"""
+        path = GRAPHITI_CONFIG["metrics_path"]
+        while True:
+            await asyncio.sleep(GRAPHITI_CONFIG["metrics_interval"])
+            try:
+                self.metrics.write_prometheus(path, self.metrics_gauges())
+            except OSError as e:
+                print(f"⚠️ Failed to write metrics to {path}: {e}", file=sys.stderr)
+    
+    async def handle_get_cache_stats(self, arguments: Dict[str, Any]) -> CallToolResult:
+        """Report search cache hit/miss counters"""
+        stats = self.query_cache.stats()
+        response = (
+            f"Search cache: {stats['entries']} entries, {stats['hits']} hits, {stats['misses']} misses "
+            f"(hit rate {stats['hit_rate']:.0%}), {stats['invalidations']} invalidations\n"
+            f"Coalesced searches: {self.coalesced_searches} "
+            f"(max {GRAPHITI_CONFIG['mcp_max_concurrent_searches']} concurrent backend searches)"
+        )
+        embedding_cache = getattr(getattr(self.graphiti, "embedder", None), "embedding_cache", None)
+        if embedding_cache is not None:
+            embeddings = embedding_cache.stats()
+            response += (
+                f"\nEmbedding cache: {embeddings['entries']} vectors, {embeddings['hits']} hits, "
+                f"{embeddings['misses']} misses (hit rate {embeddings['hit_rate']:.0%})"
+            )
+        return CallToolResult(
+            content=[TextContent(type="text", text=response)]
+        )
+    
+    async def ingest_spooled_knowledge(self, payload: Dict[str, Any]):
+        """Add one spooled add_knowledge payload to Graphiti (runs in the worker)"""
+        await self.ensure_graphiti()
+        entities = payload.get("entities", [])
+        await scheduled_add_episode(
+            self.graphiti,
+            payload["content"],
+            name=f"Agent Knowledge: {', '.join(entities[:3]) or 'General'}",
+            episode_body=payload["content"],
+            source_description=f"Added by AI agent via MCP (entities: {', '.join(entities)})",
+            reference_time=datetime.fromisoformat(payload["submitted"])
+        )
+    
     async def handle_get_project_overview(self, arguments: Dict[str, Any]) -> CallToolResult:
         """Get comprehensive project overview"""
         aspect = arguments.get("aspect", "all")
         
         try:
-            if aspect == "all":
-                query = "Toastmasters project architecture components React TypeScript Firebase"
-            elif aspect == "preferences":
-                query = "user preferences UI guidelines git workflow"
-            elif aspect == "bugs":
-                query = "bug fixes solutions month selection logic"
-            elif aspect == "business_logic":
-                query = "Toastmasters business logic meeting structure member management"
-            elif aspect == "technical":
-                query = "technical implementation data models Firebase collections"
+            if f"overview:{aspect}" in CANNED_QUERIES:
+                results = await self.canned_answer(f"overview:{aspect}")
             else:
-                query = aspect
+                results = await self.cached_search(aspect, 3)
             
-            results = await self.graphiti.search(query, limit=3)
+            if arguments.get("format") == "json":
+                return self.json_response(results, arguments, aspect=aspect)
             
             if not results:
                 return CallToolResult(
                     content=[TextContent(type="text", text="No information found for the requested aspect.")]
                 )
             
-            response = f"Project Overview - {aspect.upper()}:\n\n"
-            for result in results:
-                response += f"• {result.content}\n\n"
+            with self.metrics.stage("formatting"):
+                response = f"Project Overview - {aspect.upper()}:\n\n"
+                for result in results:
+                    response += f"• {result_content(result)}\n\n"
             
             return CallToolResult(
                 content=[TextContent(type="text", text=response)]
             )
         except Exception as e:
             return CallToolResult(
-                content=[TextContent(type="text", text=f"Failed to get overview: {str(e)}")]
+                content=[TextContent(type="text", text=f"Failed to get overview: {str(e)}")],
+                isError=True
             )
     
     async def handle_get_user_preferences(self, arguments: Dict[str, Any]) -> CallToolResult:
         """Get user preferences and guidelines"""
         try:
-            results = await self.graphiti.search("user preferences UI guidelines git workflow", limit=2)
+            results = await self.canned_answer("preferences")
+            
+            if arguments.get("format") == "json":
+                return self.json_response(results, arguments)
             
             if not results:
                 return CallToolResult(
                     content=[TextContent(type="text", text="No user preferences found in knowledge base.")]
                 )
             
-            response = "User Preferences and Guidelines:\n\n"
-            for result in results:
-                response += f"{result.content}\n\n"
+            with self.metrics.stage("formatting"):
+                response = "User Preferences and Guidelines:\n\n"
+                for result in results:
+                    response += f"{result_content(result)}\n\n"
             
             return CallToolResult(
                 content=[TextContent(type="text", text=response)]
             )
         except Exception as e:
             return CallToolResult(
-                content=[TextContent(type="text", text=f"Failed to get preferences: {str(e)}")]
+                content=[TextContent(type="text", text=f"Failed to get preferences: {str(e)}")],
+                isError=True
             )
     
     async def handle_get_recent_changes(self, arguments: Dict[str, Any]) -> CallToolResult:
@@ -277,42 +834,123 @@ class GraphitiMCPServer:
         limit = arguments.get("limit", 5)
         
         try:
-            results = await self.graphiti.search("bug fixes solutions recent changes", limit=limit)
+            results = await self.cached_search(RECENT_CHANGES_QUERY, limit)
+            
+            if arguments.get("format") == "json":
+                return self.json_response(results, arguments)
             
             if not results:
                 return CallToolResult(
                     content=[TextContent(type="text", text="No recent changes found in knowledge base.")]
                 )
             
-            response = f"Recent Changes and Bug Fixes:\n\n"
-            for i, result in enumerate(results, 1):
-                response += f"{i}. {result.content[:300]}...\n\n"
+            with self.metrics.stage("formatting"):
+                response = f"Recent Changes and Bug Fixes:\n\n"
+                for i, result in enumerate(results, 1):
+                    response += f"{i}. {result_content(result)[:300]}...\n\n"
             
             return CallToolResult(
                 content=[TextContent(type="text", text=response)]
             )
         except Exception as e:
             return CallToolResult(
-                content=[TextContent(type="text", text=f"Failed to get recent changes: {str(e)}")]
+                content=[TextContent(type="text", text=f"Failed to get recent changes: {str(e)}")],
+                isError=True
             )
     
-    async def run(self):
-        """Run the MCP server"""
-        if not MCP_AVAILABLE:
-            print("❌ MCP packages not available. Install with: pip install mcp graphiti-core[falkordb]")
-            return
-        
+    async def serve_stdio(self):
+        """Serve a single client over stdin/stdout"""
         async with stdio_server() as (read_stream, write_stream):
             await self.server.run(
                 read_stream,
                 write_stream,
                 self.server.create_initialization_options()
             )
+    
+    async def serve_sse(self, host: str, port: int):
+        """Serve any number of clients over HTTP/SSE, sharing this server's client and caches"""
+        try:
+            import uvicorn
+            from mcp.server.sse import SseServerTransport
+            from starlette.applications import Starlette
+            from starlette.responses import Response
+            from starlette.routing import Mount, Route
+        except ImportError as e:
+            print(f"❌ SSE transport unavailable ({e}). Install with: pip install --upgrade mcp", file=sys.stderr)
+            sys.exit(1)
+        
+        sse = SseServerTransport("/messages/")
+        
+        async def handle_sse(request):
+            async with sse.connect_sse(request.scope, request.receive, request._send) as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+            return Response()
+        
+        app = Starlette(routes=[
+            Route("/sse", endpoint=handle_sse),
+            Mount("/messages/", app=sse.handle_post_message)
+        ])
+        print(f"✅ Graphiti MCP Server listening on http://{host}:{port}/sse", file=sys.stderr)
+        await uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning")).serve()
+    
+    async def run(self, eager: bool = False, warmup_searches: bool = True,
+                  transport: str = "stdio", host: str = "127.0.0.1", port: int = 8765):
+        """Run the MCP server
+        
+        With eager=True the Graphiti connection, FalkorDB check, indices and
+        (optionally) warm-up searches complete before the first request is
+        served, so first-call latency matches steady state. transport="sse"
+        serves many editor sessions from this one process instead of one
+        process per stdio client.
+        """
+        if not MCP_AVAILABLE:
+            print("❌ MCP packages not available. Install with: pip install mcp graphiti-core[falkordb]")
+            return
+        
+        if eager:
+            await self.warm_up(run_searches=warmup_searches)
+        
+        # Drain knowledge spooled by this or any earlier run
+        self.ingestion_worker.start()
+        metrics_task = None
+        if GRAPHITI_CONFIG["metrics_interval"] > 0:
+            metrics_task = asyncio.create_task(self.write_metrics_periodically())
+        try:
+            if transport == "sse":
+                await self.serve_sse(host, port)
+            else:
+                await self.serve_stdio()
+        finally:
+            if metrics_task:
+                metrics_task.cancel()
+            await self.ingestion_worker.stop()
 
 async def main():
     """Main function to run the MCP server"""
+    parser = argparse.ArgumentParser(description="Graphiti MCP server for the Toastmasters knowledge base")
+    parser.add_argument("--eager", action="store_true", default=GRAPHITI_CONFIG["mcp_eager"],
+                        help="connect, build indices and warm caches before serving")
+    parser.add_argument("--no-warmup-searches", dest="warmup_searches", action="store_false",
+                        default=GRAPHITI_CONFIG["mcp_warmup_searches"],
+                        help="skip warm-up searches in eager mode")
+    parser.add_argument("--transport", choices=["stdio", "sse"], default=GRAPHITI_CONFIG["mcp_transport"],
+                        help="stdio for one client per process, sse for a shared HTTP server")
+    parser.add_argument("--host", default=GRAPHITI_CONFIG["mcp_host"], help="address to listen on with --transport sse")
+    parser.add_argument("--port", type=int, default=GRAPHITI_CONFIG["mcp_port"], help="port to listen on with --transport sse")
+    args = parser.parse_args()
+    
     server = GraphitiMCPServer()
-    await server.run()
+    await server.run(
+        eager=args.eager,
+        warmup_searches=args.warmup_searches,
+        transport=args.transport,
+        host=args.host,
+        port=args.port
+    )
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Query Result Cache for Toastmasters AI Agent
+In-process LRU cache with a time-to-live for knowledge base search results,
+so agents repeating the same query skip the hybrid-search round-trip, and a
+short-lived store of full result sets that search cursors page through.
+"""
+
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query, used for cache keys"""
+    return " ".join(query.lower().split())
+
+
+class QueryCache:
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        # Bumped on every invalidation so searches started before a write
+        # cannot repopulate the cache with pre-write results
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (hit, value) for a key, evicting it if it has expired"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            if time.monotonic() - stored_at < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value
+            del self._entries[key]
+        self.misses += 1
+        return False, None
+
+    def put(self, key: Hashable, value: Any, generation: Optional[int] = None):
+        """Store a value, unless the cache was invalidated since `generation`"""
+        if generation is not None and generation != self.generation:
+            return
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """Drop every cached result after a write to the knowledge base"""
+        self._entries.clear()
+        self.generation += 1
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations
+        }
+
+
+class ResultSetStore:
+    """Full search result sets kept for a short time so agents can page through them"""
+
+    def __init__(self, max_sets: int = 64, ttl_seconds: float = 600.0):
+        self.max_sets = max_sets
+        self.ttl_seconds = ttl_seconds
+        self._sets: "OrderedDict[str, Tuple[float, List[Any]]]" = OrderedDict()
+
+    def save(self, results: List[Any]) -> str:
+        """Keep a result set and return its id"""
+        set_id = secrets.token_urlsafe(9)
+        self._sets[set_id] = (time.monotonic(), results)
+        while len(self._sets) > self.max_sets:
+            self._sets.popitem(last=False)
+        return set_id
+
+    def get(self, set_id: str) -> Optional[List[Any]]:
+        """Return a result set, extending its lifetime, or None once it has expired"""
+        entry = self._sets.get(set_id)
+        if entry is None:
+            return None
+        stored_at, results = entry
+        now = time.monotonic()
+        if now - stored_at >= self.ttl_seconds:
+            del self._sets[set_id]
+            return None
+        self._sets[set_id] = (now, results)
+        self._sets.move_to_end(set_id)
+        return results
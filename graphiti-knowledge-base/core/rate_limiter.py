@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Rate Limit Scheduler for Toastmasters AI Agent
+Keeps LLM-backed ingestion under the provider's requests-per-minute and
+tokens-per-minute budgets, and backs off with jitter and retries when the
+provider still answers 429, so long backfills finish instead of dropping
+episodes.
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Optional, Tuple
+
+# Import configuration
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
+from config import GRAPHITI_CONFIG
+
+# Graphiti makes several LLM calls per episode (entity extraction, dedupe,
+# edge extraction, ...), each resending the episode plus its prompt.
+EXTRACTION_CALLS_PER_EPISODE = 4
+PROMPT_OVERHEAD_TOKENS = 800
+WINDOW_SECONDS = 60.0
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token cost of extracting one episode (about 4 characters per token)"""
+    return EXTRACTION_CALLS_PER_EPISODE * (len(text) // 4 + PROMPT_OVERHEAD_TOKENS)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Recognize 429 / rate-limit errors from the OpenAI client or wrapped by Graphiti
+
+    Matches on the HTTP status or the exception type (openai.RateLimitError,
+    graphiti_core's RateLimitError), following the exception chain. The
+    message is not inspected, so a 429 that merely appears in an episode or
+    an id is not mistaken for throttling.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if getattr(error, "status_code", None) == 429 or getattr(error, "status", None) == 429:
+            return True
+        if type(error).__name__.lower() in ("ratelimiterror", "ratelimitexceeded"):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class TokenBudgetScheduler:
+    def __init__(self,
+                 requests_per_minute: int,
+                 tokens_per_minute: int,
+                 base_backoff: float = 2.0,
+                 max_backoff: float = 60.0,
+                 max_rate_limit_retries: Optional[int] = 8):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_rate_limit_retries = max_rate_limit_retries
+        # (admitted_at, requests, tokens) for calls admitted in the last minute
+        self._window: Deque[Tuple[float, int, int]] = deque()
+        self._window_requests = 0
+        self._window_tokens = 0
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.rate_limited = 0
+
+    def _expire(self, now: float):
+        while self._window and now - self._window[0][0] >= WINDOW_SECONDS:
+            _, requests, tokens = self._window.popleft()
+            self._window_requests -= requests
+            self._window_tokens -= tokens
+
+    def _free_time(self, field: int, excess: int, now: float) -> float:
+        """Seconds until enough window entries expire to free `excess` of column `field`"""
+        freed = 0
+        for entry in self._window:
+            freed += entry[field]
+            if freed >= excess:
+                return entry[0] + WINDOW_SECONDS - now
+        return 0.0
+
+    def _wait_time(self, requests: int, tokens: int, now: float) -> float:
+        """Seconds until a call costing `requests` and `tokens` fits in both budgets"""
+        wait = max(0.0, self._paused_until - now)
+        if not self._window:
+            # A single call larger than a whole budget is admitted on an empty window
+            return wait
+        excess_requests = self._window_requests + requests - self.requests_per_minute
+        if excess_requests > 0:
+            wait = max(wait, self._free_time(1, excess_requests, now))
+        excess_tokens = self._window_tokens + tokens - self.tokens_per_minute
+        if excess_tokens > 0:
+            wait = max(wait, self._free_time(2, excess_tokens, now))
+        return wait
+
+    async def acquire(self, tokens: int, requests: int = 1):
+        """Wait until a call costing `requests` provider requests and `tokens` fits the budgets, then admit it"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+        # Admission is serialized so callers are served in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                wait = self._wait_time(requests, tokens, now)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            self._window.append((now, requests, tokens))
+            self._window_requests += requests
+            self._window_tokens += tokens
+
+    async def run(self, call: Callable[[], Awaitable[Any]], tokens: int, requests: int = 1) -> Any:
+        """Run `call` within budget, requeueing it with jittered backoff on 429s
+
+        After `max_rate_limit_retries` consecutive 429s the error is raised
+        (None retries without limit).
+        """
+        attempt = 0
+        while True:
+            await self.acquire(tokens, requests)
+            try:
+                return await call()
+            except Exception as e:
+                if not is_rate_limit_error(e):
+                    raise
+                attempt += 1
+                self.rate_limited += 1
+                if self.max_rate_limit_retries is not None and attempt > self.max_rate_limit_retries:
+                    raise
+                # Full jitter; pausing admission makes every caller back off together
+                delay = random.uniform(0, min(self.max_backoff, self.base_backoff * (2 ** attempt)))
+                self._paused_until = max(self._paused_until, time.monotonic() + delay)
+                print(f"⏳ Rate limited, retrying in {delay:.1f}s (attempt {attempt})", file=sys.stderr)
+
+
+_default_scheduler: Optional[TokenBudgetScheduler] = None
+
+
+def get_scheduler() -> TokenBudgetScheduler:
+    """Process-wide scheduler shared by every ingestion path"""
+    global _default_scheduler
+    if _default_scheduler is None:
+        _default_scheduler = TokenBudgetScheduler(
+            requests_per_minute=GRAPHITI_CONFIG["llm_requests_per_minute"],
+            tokens_per_minute=GRAPHITI_CONFIG["llm_tokens_per_minute"],
+            max_rate_limit_retries=GRAPHITI_CONFIG["llm_rate_limit_retries"]
+        )
+    return _default_scheduler
+
+
+async def scheduled_add_episode(graphiti, episode_text: str, **kwargs: Any) -> Any:
+    """Call graphiti.add_episode through the shared scheduler, charged as one episode's extraction calls"""
+    return await get_scheduler().run(lambda: graphiti.add_episode(**kwargs), estimate_tokens(episode_text),
+                                     requests=EXTRACTION_CALLS_PER_EPISODE)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Compact Response Format for Toastmasters AI Agent
+Turns search results into small JSON records (id, score, snippet, entities)
+for MCP clients that ask for format="json", optionally limited to selected
+fields and trimmed to a token budget.
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+RESULT_FIELDS = ("id", "score", "title", "snippet", "content", "entities")
+DEFAULT_FIELDS = ("id", "score", "snippet", "entities")
+SNIPPET_CHARS = 160
+MAX_ENTITIES = 5
+
+# Input schema properties shared by every tool that returns search results
+RESPONSE_FORMAT_PROPERTIES = {
+    "format": {
+        "type": "string",
+        "enum": ["text", "json"],
+        "description": "text for readable output, json for compact records (id, score, snippet, entities)",
+        "default": "text"
+    },
+    "fields": {
+        "type": "array",
+        "items": {"type": "string", "enum": list(RESULT_FIELDS)},
+        "description": "Fields to include in each json record (default: id, score, snippet, entities)"
+    },
+    "max_tokens": {
+        "type": "integer",
+        "description": "Approximate token budget for a json response; lowest-ranked results beyond the first are dropped to fit"
+    }
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token)"""
+    return len(text) // 4 + 1
+
+
+def result_content(result: Any) -> str:
+    """Text of a search result: episode/local content, or the fact of a Graphiti edge"""
+    return getattr(result, "content", None) or getattr(result, "fact", None) or ""
+
+
+def result_record(result: Any, fields: Sequence[str]) -> Dict[str, Any]:
+    """Compact record for one result, keeping only the requested fields that have a value"""
+    content = result_content(result)
+    values = {
+        "id": getattr(result, "uuid", None),
+        "score": round(result.score, 4) if isinstance(getattr(result, "score", None), float) else None,
+        "title": getattr(result, "title", None) or getattr(result, "name", None),
+        "content": content,
+        "entities": list(getattr(result, "entities", None) or [])[:MAX_ENTITIES] or None
+    }
+    if "snippet" in fields:
+        flat = " ".join(content.split())
+        values["snippet"] = flat if len(flat) <= SNIPPET_CHARS else flat[:SNIPPET_CHARS].rsplit(" ", 1)[0] + "…"
+    return {field: values[field] for field in fields if values.get(field) not in (None, "")}
+
+
+def compact_json(payload: Dict[str, Any]) -> str:
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def format_results_json(results: List[Any],
+                        fields: Optional[Sequence[str]] = None,
+                        max_tokens: Optional[int] = None,
+                        next_cursor: Optional[Callable[[int], Optional[str]]] = None,
+                        **extra: Any) -> str:
+    """Serialize results as compact JSON, dropping trailing results past max_tokens
+
+    `extra` adds top-level keys (total, degraded, ...); None values are left
+    out. The first result is always kept, and "truncated": true marks dropped
+    results. `next_cursor`, if given, is called with the number of results
+    kept and returns the cursor for the rest (or None).
+    """
+    fields = [field for field in (fields or DEFAULT_FIELDS) if field in RESULT_FIELDS] or list(DEFAULT_FIELDS)
+    records = [result_record(result, fields) for result in results]
+
+    def render(kept: int) -> str:
+        payload = {key: value for key, value in extra.items() if value is not None}
+        cursor = next_cursor(kept) if next_cursor else None
+        if cursor:
+            payload["next_cursor"] = cursor
+        if kept < len(records):
+            payload["truncated"] = True
+        payload["results"] = records[:kept]
+        return compact_json(payload)
+
+    kept = len(records)
+    text = render(kept)
+    while max_tokens and kept > 1 and estimate_tokens(text) > max_tokens:
+        kept -= 1
+        text = render(kept)
+    return text
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Server Metrics for Toastmasters AI Agent
+Latency histograms and error counters for MCP tool calls and the backend
+stages behind them (embedding, graph query, formatting), reported through
+the get_server_stats tool and a Prometheus text file.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# Upper bounds in seconds, as in the Prometheus client's default buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by interpolating inside its bucket"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for bound, bucket_count in zip(self.buckets + (self.max,), self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                upper = min(bound, self.max)
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+            lower = bound
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p50_ms": self.quantile(0.5) * 1000,
+            "p95_ms": self.quantile(0.95) * 1000,
+            "max_ms": self.max * 1000
+        }
+
+
+class ServerMetrics:
+    def __init__(self):
+        self.tools: Dict[str, LatencyHistogram] = {}
+        self.tool_errors: Dict[str, int] = {}
+        self.stages: Dict[str, LatencyHistogram] = {}
+        self.started_at = time.time()
+
+    def observe_tool(self, tool: str, seconds: float, error: bool = False):
+        self.tools.setdefault(tool, LatencyHistogram()).observe(seconds)
+        if error:
+            self.tool_errors[tool] = self.tool_errors.get(tool, 0) + 1
+
+    def observe_stage(self, stage: str, seconds: float):
+        self.stages.setdefault(stage, LatencyHistogram()).observe(seconds)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block of work as one observation of a backend stage"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe_stage(name, time.perf_counter() - started)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "uptime_seconds": time.time() - self.started_at,
+            "tools": {
+                name: {**histogram.summary(), "errors": self.tool_errors.get(name, 0)}
+                for name, histogram in sorted(self.tools.items())
+            },
+            "stages": {name: histogram.summary() for name, histogram in sorted(self.stages.items())}
+        }
+
+    def render_prometheus(self, gauges: Optional[Dict[str, float]] = None) -> str:
+        """Render all metrics in the Prometheus text exposition format
+
+        `gauges` are extra point-in-time values; names ending in _total are
+        typed as counters.
+        """
+        lines: List[str] = []
+
+        def histogram_lines(metric: str, label: str, histograms: Dict[str, LatencyHistogram]):
+            lines.append(f"# TYPE {metric} histogram")
+            for name, histogram in sorted(histograms.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f'{metric}_bucket{{{label}="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{{label}="{name}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{metric}_sum{{{label}="{name}"}} {histogram.total:.6f}')
+                lines.append(f'{metric}_count{{{label}="{name}"}} {histogram.count}')
+
+        histogram_lines("graphiti_mcp_tool_duration_seconds", "tool", self.tools)
+        lines.append("# TYPE graphiti_mcp_tool_errors_total counter")
+        for name in sorted(self.tools):
+            lines.append(f'graphiti_mcp_tool_errors_total{{tool="{name}"}} {self.tool_errors.get(name, 0)}')
+        histogram_lines("graphiti_mcp_stage_duration_seconds", "stage", self.stages)
+        for name, value in sorted((gauges or {}).items()):
+            lines.append(f"# TYPE {name} {'counter' if name.endswith('_total') else 'gauge'}")
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, gauges: Optional[Dict[str, float]] = None):
+        """Write the Prometheus text file atomically (for node_exporter's textfile collector)"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render_prometheus(gauges))
+        os.replace(tmp_path, path)
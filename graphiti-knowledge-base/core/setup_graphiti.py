@@ -5,10 +5,19 @@ This script sets up Graphiti as a persistent knowledge base for AI agents
 working on the Toastmasters project.
 """
 
+import asyncio
 import os
 import sys
-from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+# Add the current directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from ingestion_pipeline import ingest_episode, run_bounded
+from ingestion_ledger import IngestionLedger
+
+# Import configuration
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
+from config import GRAPHITI_CONFIG
 
 # Try to import Graphiti - will fail gracefully if not installed
 try:
@@ -213,27 +222,67 @@ def create_toastmasters_episodes() -> List[Dict[str, Any]]:
     
     return episodes
 
-async def populate_knowledge_base(graphiti):
-    """Populate the knowledge base with initial episodes"""
-    print("Creating knowledge episodes...")
+async def populate_knowledge_base(graphiti,
+                                  concurrency: Optional[int] = None,
+                                  max_retries: Optional[int] = None,
+                                  force: bool = False):
+    """Populate the knowledge base with initial episodes
+
+    Episodes are added concurrently, with at most `concurrency` extraction
+    calls in flight across all episodes and their chunks, so the LLM
+    provider's rate limits are respected.
+    Episodes already recorded in the ingestion ledger are skipped unless
+    `force` is set.
+    """
+    if concurrency is None:
+        concurrency = GRAPHITI_CONFIG["ingest_concurrency"]
+    if max_retries is None:
+        max_retries = GRAPHITI_CONFIG["ingest_max_retries"]
+    
+    print(f"Creating knowledge episodes (concurrency: {concurrency})...")
     
     episodes = create_toastmasters_episodes()
+    ledger = IngestionLedger(GRAPHITI_CONFIG["ledger_path"])
+    # One limit for every chunk of every episode; the chunk calls also carry the only retries
+    slots = asyncio.Semaphore(max(1, concurrency))
     
-    for i, episode_data in enumerate(episodes, 1):
-        try:
-            # Add episode to Graphiti using correct API
-            from datetime import datetime
-            await graphiti.add_episode(
-                name=f"Toastmasters Knowledge Episode {i}",
-                episode_body=episode_data["content"],
-                source_description="Initial knowledge base setup",
-                reference_time=datetime.now()
-            )
+    async def add_episode(item):
+        i, episode_data = item
+        # Add episode to Graphiti using correct API
+        result = await ingest_episode(
+            graphiti,
+            ledger,
+            name=f"Toastmasters Knowledge Episode {i}",
+            episode_body=episode_data["content"],
+            source_description="Initial knowledge base setup",
+            force=force,
+            concurrency=concurrency,
+            max_retries=max_retries,
+            semaphore=slots
+        )
+        return result["added"] > 0
+    
+    def report(outcome):
+        i = outcome["index"] + 1
+        if outcome["success"] and not outcome["result"]:
+            print(f"Episode {i}/{len(episodes)} unchanged, skipped")
+        elif outcome["success"]:
             print(f"Episode {i}/{len(episodes)} created")
-        except Exception as e:
-            print(f"Failed to create episode {i}: {e}")
+        else:
+            print(f"Failed to create episode {i}: {outcome['error']}")
+    
+    # Episodes only wait on the shared slots, so they are all started at once
+    results = await run_bounded(
+        list(enumerate(episodes, 1)),
+        add_episode,
+        concurrency=len(episodes),
+        max_retries=0,
+        on_result=report
+    )
     
-    print(f"Knowledge base populated with {len(episodes)} episodes!")
+    created = sum(1 for outcome in results if outcome["success"] and outcome["result"])
+    skipped = sum(1 for outcome in results if outcome["success"] and not outcome["result"])
+    print(f"Knowledge base populated with {created}/{len(episodes)} episodes ({skipped} unchanged)!")
 
 async def test_knowledge_base(graphiti):
     """Test the knowledge base with sample queries"""
@@ -273,7 +322,8 @@ async def main():
     print("Graphiti initialized successfully")
     
     # Populate with knowledge
-    await populate_knowledge_base(graphiti)
+    # Pass --force to re-ingest episodes the ledger already has
+    await populate_knowledge_base(graphiti, force="--force" in sys.argv)
     
     # Test the knowledge base
     await test_knowledge_base(graphiti)
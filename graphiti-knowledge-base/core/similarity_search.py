@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Similarity Search for Toastmasters AI Agent
+TF-IDF vectors for every episode and every section (blank-line separated
+block) of its content, held in one SciPy CSR matrix. A query is answered with
+a single sparse matrix-vector product and an argpartition top-k, entirely
+offline. Requires the optional numpy and scipy packages.
+
+Usage: python similarity_search.py "query" [--hashed] [--limit N]
+"""
+
+import json
+import math
+import os
+import re
+import sys
+import textwrap
+import zlib
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from local_knowledge import episode_fields, tokenize
+
+try:
+    import numpy as np
+    from scipy import sparse
+    SIMILARITY_AVAILABLE = True
+except ImportError:
+    SIMILARITY_AVAILABLE = False
+
+DEFAULT_JSON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "toastmasters_knowledge.json")
+HASHED_FEATURES = 2 ** 18
+SECTION_BREAK = re.compile(r"\n\s*\n")
+
+
+def split_sections(content: str) -> List[str]:
+    """Blank-line separated blocks of an episode's content, so a heading stays with its list"""
+    return [block.strip() for block in SECTION_BREAK.split(textwrap.dedent(content).strip()) if block.strip()]
+
+
+class SimilarityResult:
+    def __init__(self, episode: Dict[str, Any], section: Optional[int], text: str, score: float):
+        self.episode = episode
+        self.section = section  # None when the whole episode matched
+        self.text = text
+        self.score = score
+
+
+class TfidfIndex:
+    """L2-normalized TF-IDF rows for episodes and their sections
+
+    With `n_features` set, terms are hashed (crc32) into that many columns
+    instead of keeping a vocabulary, which bounds memory on large corpora at
+    the cost of rare collisions.
+    """
+
+    def __init__(self, episodes: List[Dict[str, Any]], n_features: Optional[int] = None):
+        if not SIMILARITY_AVAILABLE:
+            raise ImportError("Similarity search needs numpy and scipy: pip install numpy scipy")
+        self.episodes = episodes
+        self.n_features = n_features
+        self.vocabulary: Dict[str, int] = {}
+        # One row per episode (title, entities, content) followed by its sections
+        self.rows: List[tuple] = []
+        texts: List[str] = []
+        for i, episode in enumerate(episodes):
+            self.rows.append((i, None))
+            texts.append(" ".join(episode_fields(episode).values()))
+            for s, section in enumerate(split_sections(episode.get("content", ""))):
+                self.rows.append((i, s))
+                texts.append(section)
+
+        counts = [Counter(self._column(term, grow=True) for term in tokenize(text)) for text in texts]
+        width = n_features or len(self.vocabulary)
+        df = np.zeros(width)
+        for row in counts:
+            df[list(row)] += 1
+        # Smoothed idf, as in scikit-learn's TfidfVectorizer
+        self.idf = np.log((1 + len(texts)) / (1 + df)) + 1
+
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        for row in counts:
+            indices.extend(row)
+            data.extend(1 + math.log(tf) for tf in row.values())
+            indptr.append(len(indices))
+        matrix = sparse.csr_matrix(
+            (np.array(data, dtype=np.float64), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(len(texts), width)
+        )
+        matrix = matrix.multiply(self.idf).tocsr()
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        self.matrix = sparse.diags(1 / norms) @ matrix
+        self.is_section = np.array([section is not None for _, section in self.rows])
+        self.sections = {i: split_sections(episode.get("content", "")) for i, episode in enumerate(episodes)}
+
+    def _column(self, term: str, grow: bool = False) -> Optional[int]:
+        if self.n_features:
+            return zlib.crc32(term.encode("utf-8")) % self.n_features
+        if grow:
+            return self.vocabulary.setdefault(term, len(self.vocabulary))
+        return self.vocabulary.get(term)
+
+    def vectorize(self, query: str):
+        """Normalized TF-IDF vector for a query; terms outside the vocabulary are dropped
+
+        Dense rather than sparse: CSR times a dense vector is a single pass
+        over the matrix's nonzeros and measured several times faster than a
+        sparse-by-sparse product, even with hashed features.
+        """
+        counts = Counter(column for column in map(self._column, tokenize(query)) if column is not None)
+        vector = np.zeros(self.matrix.shape[1])
+        for column, tf in counts.items():
+            vector[column] = (1 + math.log(tf)) * self.idf[column]
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def search(self, query: str, limit: int = 10, level: Optional[str] = None) -> List[SimilarityResult]:
+        """Cosine-ranked episodes and sections, best first
+
+        `level` restricts results to "episode" or "section" rows.
+        """
+        scores = self.matrix @ self.vectorize(query)
+        if level == "episode":
+            scores[self.is_section] = 0.0
+        elif level == "section":
+            scores[~self.is_section] = 0.0
+        k = min(limit, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        results = []
+        for row in top:
+            if scores[row] <= 0:
+                break
+            i, section = self.rows[row]
+            text = self.sections[i][section] if section is not None else self.episodes[i].get("content", "").strip()
+            results.append(SimilarityResult(self.episodes[i], section, text, float(scores[row])))
+        return results
+
+
+def main():
+    args = sys.argv[1:]
+    if not args or args[0].startswith("--"):
+        print('Usage: python similarity_search.py "query" [--hashed] [--limit N]')
+        return
+    if not SIMILARITY_AVAILABLE:
+        print("❌ Similarity search needs numpy and scipy: pip install numpy scipy")
+        return
+    limit = int(args[args.index("--limit") + 1]) if "--limit" in args else 5
+    with open(DEFAULT_JSON_PATH, 'r', encoding='utf-8') as f:
+        episodes = json.load(f).get("episodes", [])
+    index = TfidfIndex(episodes, n_features=HASHED_FEATURES if "--hashed" in args else None)
+    for result in index.search(args[0], limit):
+        where = f"section {result.section + 1}" if result.section is not None else "episode"
+        print(f"{result.score:.3f}  {result.episode.get('title', '')} ({where})")
+        print(f"       {' '.join(result.text.split())[:120]}")
+
+
+if __name__ == "__main__":
+    main()
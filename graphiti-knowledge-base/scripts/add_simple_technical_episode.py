@@ -7,7 +7,6 @@ This script adds a simplified technical implementation episode to avoid rate lim
 import asyncio
 import os
 import sys
-from datetime import datetime
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -16,7 +15,10 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
-from config import setup_environment
+from config import GRAPHITI_CONFIG, setup_environment
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
+from ingestion_ledger import IngestionLedger
+from ingestion_pipeline import ingest_episode
 
 try:
     from graphiti_core import Graphiti
@@ -27,7 +29,7 @@ except ImportError:
     GRAPHITI_AVAILABLE = False
     sys.exit(1)
 
-async def add_simple_technical_episode():
+async def add_simple_technical_episode(force: bool = False):
     """Add a simplified technical implementation episode to Graphiti"""
     
     try:
@@ -43,6 +45,9 @@ async def add_simple_technical_episode():
         
         print("Connected to Graphiti knowledge base")
         
+        # Episodes whose content is already in the ledger are skipped
+        ledger = IngestionLedger(GRAPHITI_CONFIG["ledger_path"])
+        
         # Add simplified technical implementation episode
         technical_content = """
         Technical Implementation Details for Toastmasters App:
@@ -133,14 +138,19 @@ async def add_simple_technical_episode():
         """
         
         # Add the simplified technical implementation episode
-        await graphiti.add_episode(
+        result = await ingest_episode(
+            graphiti,
+            ledger,
             name="Technical Implementation Guide",
             episode_body=technical_content,
             source_description="Technical implementation details for Toastmasters app",
-            reference_time=datetime.now()
+            force=force
         )
         
-        print("SUCCESS: Technical implementation knowledge added to Graphiti knowledge base")
+        if result["added"]:
+            print(f"SUCCESS: Technical implementation knowledge updated in Graphiti knowledge base ({result['added']} of {result['chunks']} sections re-extracted, {result['removed']} superseded removed)")
+        else:
+            print("SKIPPED: Technical implementation knowledge unchanged since last ingestion (use --force to re-ingest)")
         
         # Search to verify the knowledge was added
         print("\nVerifying knowledge base updates...")
@@ -157,4 +167,5 @@ async def add_simple_technical_episode():
         raise
 
 if __name__ == "__main__":
-    asyncio.run(add_simple_technical_episode())
+    # Pass --force to re-ingest content the ledger already has
+    asyncio.run(add_simple_technical_episode(force="--force" in sys.argv))
@@ -7,7 +7,6 @@ This script adds the detailed technical implementation episode to the Graphiti k
 import asyncio
 import os
 import sys
-from datetime import datetime
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -16,7 +15,10 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
-from config import setup_environment
+from config import GRAPHITI_CONFIG, setup_environment
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
+from ingestion_ledger import IngestionLedger
+from ingestion_pipeline import ingest_episode
 
 try:
     from graphiti_core import Graphiti
@@ -27,7 +29,7 @@ except ImportError:
     GRAPHITI_AVAILABLE = False
     sys.exit(1)
 
-async def add_technical_episode():
+async def add_technical_episode(force: bool = False):
     """Add the detailed technical implementation episode to Graphiti"""
     
     try:
@@ -43,6 +45,9 @@ async def add_technical_episode():
         
         print("Connected to Graphiti knowledge base")
         
+        # Episodes whose content is already in the ledger are skipped
+        ledger = IngestionLedger(GRAPHITI_CONFIG["ledger_path"])
+        
         # Add detailed technical implementation episode
         technical_content = """
         Detailed Technical Implementation Guide:
@@ -540,14 +545,19 @@ async def add_technical_episode():
         """
         
         # Add the detailed technical implementation episode
-        await graphiti.add_episode(
+        result = await ingest_episode(
+            graphiti,
+            ledger,
             name="Detailed Technical Implementation Guide",
             episode_body=technical_content,
             source_description="Comprehensive technical implementation details for Toastmasters app",
-            reference_time=datetime.now()
+            force=force
         )
         
-        print("SUCCESS: Detailed technical implementation knowledge added to Graphiti knowledge base")
+        if result["added"]:
+            print(f"SUCCESS: Detailed technical implementation knowledge updated in Graphiti knowledge base ({result['added']} of {result['chunks']} sections re-extracted, {result['removed']} superseded removed)")
+        else:
+            print("SKIPPED: Detailed technical implementation knowledge unchanged since last ingestion (use --force to re-ingest)")
         
         # Search to verify the knowledge was added
         print("\nVerifying knowledge base updates...")
@@ -564,4 +574,5 @@ async def add_technical_episode():
         raise
 
 if __name__ == "__main__":
-    asyncio.run(add_technical_episode())
+    # Pass --force to re-ingest content the ledger already has
+    asyncio.run(add_technical_episode(force="--force" in sys.argv))
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Ingestion Throughput Benchmark for Toastmasters AI Agent
+Drives KnowledgeIngestionManager and populate_knowledge_base against a local
+stand-in for Graphiti with simulated extraction latency, so changes to the
+ingestion path can be measured without FalkorDB or OpenAI. Latency columns
+are end-to-end per episode: from the moment the batch is submitted until the
+episode's last chunk is in the graph, so they include queueing in the
+concurrency pool and waits in the rate-limit scheduler.
+
+Usage: python benchmark_ingestion.py [--concurrency 1,4,8] [--sizes 500,4000,20000]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Keep benchmark state out of the real ledger/log, and take the provider
+# budgets out of the picture (unless set explicitly) so the numbers reflect
+# the pipeline itself
+_BENCH_DIR = tempfile.mkdtemp(prefix="graphiti-bench-")
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-not-used")
+os.environ["GRAPHITI_LEDGER_PATH"] = os.path.join(_BENCH_DIR, "ledger.json")
+os.environ["GRAPHITI_INGESTION_LOG"] = os.path.join(_BENCH_DIR, "ingestion_log.jsonl")
+os.environ.setdefault("GRAPHITI_LLM_RPM", "1000000")
+os.environ.setdefault("GRAPHITI_LLM_TPM", "1000000000")
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
+import setup_graphiti
+from ingest_knowledge import KnowledgeIngestionManager
+
+
+class FakeEpisode:
+    def __init__(self, uuid: str):
+        self.uuid = uuid
+
+
+class FakeAddEpisodeResults:
+    def __init__(self, uuid: str):
+        self.episode = FakeEpisode(uuid)
+
+
+class FakeGraphiti:
+    """Local Graphiti stand-in: add_episode sleeps like an LLM extraction round-trip
+
+    Methods mirror graphiti_core's signatures, so a call the real client
+    would reject fails here too.
+    """
+
+    def __init__(self, latency: float, per_kchar_latency: float, jitter: float):
+        self.latency = latency
+        self.per_kchar_latency = per_kchar_latency
+        self.jitter = jitter
+        self.submitted_at = 0.0
+        # Completion time of the last chunk of each episode, by parent episode name
+        self.finished_at: Dict[str, float] = {}
+        self.episodes = 0
+
+    async def add_episode(self,
+                          name: str,
+                          episode_body: str,
+                          source_description: str,
+                          reference_time: datetime,
+                          source: Any = None,
+                          group_id: Optional[str] = None,
+                          uuid: Optional[str] = None,
+                          update_communities: bool = False,
+                          entity_types: Optional[Dict[str, Any]] = None,
+                          excluded_entity_types: Optional[List[str]] = None,
+                          previous_episode_uuids: Optional[List[str]] = None,
+                          edge_types: Optional[Dict[str, Any]] = None,
+                          edge_type_map: Optional[Dict[Any, List[str]]] = None) -> FakeAddEpisodeResults:
+        delay = self.latency + self.per_kchar_latency * len(episode_body) / 1000
+        await asyncio.sleep(max(0.0, random.gauss(delay, delay * self.jitter)))
+        # Chunks are named "<parent> [i/n]: <heading>"
+        self.finished_at[name.split(" [")[0]] = time.perf_counter()
+        self.episodes += 1
+        return FakeAddEpisodeResults(f"fake-{self.episodes}")
+
+    async def remove_episode(self, episode_uuid: str):
+        await asyncio.sleep(self.latency / 10)
+
+    async def search(self,
+                     query: str,
+                     center_node_uuid: Optional[str] = None,
+                     group_ids: Optional[List[str]] = None,
+                     num_results: int = 10,
+                     search_filter: Any = None) -> List[Any]:
+        await asyncio.sleep(self.latency / 4)
+        return []
+
+    async def close(self):
+        pass
+
+
+def synthetic_body(size: int, seed: int) -> str:
+    """Episode text of about `size` characters, shaped like the real episodes"""
+    rng = random.Random(seed)
+    words = ["schedule", "member", "agenda", "Firestore", "mentorship", "role", "meeting",
+             "React", "component", "context", "permission", "export", "notification"]
+    lines = [f"SECTION {seed} OVERVIEW:", ""]
+    section = 1
+    while sum(len(l) + 1 for l in lines) < size:
+        if len(lines) % 12 == 0:
+            section += 1
+            lines += ["", f"{section}. Subsection {section}:"]
+        lines.append("- " + " ".join(rng.choice(words) for _ in range(12)))
+    return "\n".join(lines)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def bench_manager(fake: FakeGraphiti, episodes: int, size: int, concurrency: int):
+    manager = KnowledgeIngestionManager(graphiti=fake)
+    insights = [
+        dict(title=f"Benchmark insight {i}", content=synthetic_body(size, i),
+             category="benchmark", entities=["Benchmark"])
+        for i in range(episodes)
+    ]
+    fake.submitted_at = time.perf_counter()
+    await manager.add_insights(insights, concurrency=concurrency)
+
+
+async def bench_setup(fake: FakeGraphiti, episodes: int, size: int, concurrency: int):
+    setup_graphiti.create_toastmasters_episodes = lambda: [
+        {"content": synthetic_body(size, i), "entities": ["Benchmark"]} for i in range(episodes)
+    ]
+    fake.submitted_at = time.perf_counter()
+    await setup_graphiti.populate_knowledge_base(fake, concurrency=concurrency, max_retries=0, force=True)
+
+
+TARGETS = {"manager": bench_manager, "setup": bench_setup}
+
+
+def run_case(target: str, args: argparse.Namespace, size: int, concurrency: int) -> Dict[str, Any]:
+    fake = FakeGraphiti(args.latency, args.per_kchar_latency, args.jitter)
+    tracemalloc.start()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        asyncio.run(TARGETS[target](fake, args.episodes, size, concurrency))
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    latencies = [finished - fake.submitted_at for finished in fake.finished_at.values()]
+    return {
+        "target": target,
+        "size": size,
+        "concurrency": concurrency,
+        "calls": fake.episodes,
+        "episodes_per_sec": args.episodes / elapsed,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "elapsed": elapsed,
+        "peak_mb": peak / (1024 * 1024)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark knowledge base ingestion against a fake Graphiti")
+    parser.add_argument("--targets", default="manager,setup", help="comma-separated: manager, setup")
+    parser.add_argument("--concurrency", default="1,2,4,8", help="comma-separated concurrency levels")
+    parser.add_argument("--sizes", default="500,4000,20000", help="comma-separated episode sizes in characters")
+    parser.add_argument("--episodes", type=int, default=24, help="episodes per run")
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated seconds per add_episode call")
+    parser.add_argument("--per-kchar-latency", type=float, default=0.01,
+                        help="extra simulated seconds per 1000 characters of episode body")
+    parser.add_argument("--jitter", type=float, default=0.2, help="relative standard deviation of latency")
+    args = parser.parse_args()
+
+    print("INGESTION THROUGHPUT BENCHMARK (fake Graphiti)")
+    print("=" * 96)
+    print(f"{'target':<8} {'size':>6} {'conc':>5} {'calls':>6} {'eps/s':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'total s':>8} {'peak MB':>8}")
+    for target in args.targets.split(","):
+        for size in (int(s) for s in args.sizes.split(",")):
+            for concurrency in (int(c) for c in args.concurrency.split(",")):
+                r = run_case(target.strip(), args, size, concurrency)
+                print(f"{r['target']:<8} {r['size']:>6} {r['concurrency']:>5} {r['calls']:>6} "
+                      f"{r['episodes_per_sec']:>8.1f} {r['p50'] * 1000:>8.1f} {r['p95'] * 1000:>8.1f} "
+                      f"{r['elapsed']:>8.2f} {r['peak_mb']:>8.2f}")
+    print("=" * 96)
+    print("p50/p95: time from submitting the batch until an episode was fully ingested.")
+    print("calls > episodes means oversized episodes were split into section chunks.")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,6 @@ Check what's currently in the Graphiti knowledge base
 import asyncio
 import os
 import sys
-from datetime import datetime
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -15,11 +14,11 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
 from config import setup_environment
 
 try:
-    from graphiti_core import Graphiti
-    from graphiti_core.driver.falkordb_driver import FalkorDriver
+    from graphiti_client import close_graphiti, create_graphiti
     GRAPHITI_AVAILABLE = True
 except ImportError:
     print("ERROR: Graphiti not installed. Please run: pip install graphiti-core[falkordb]")
@@ -33,12 +32,8 @@ async def check_knowledge():
         # Set up environment
         setup_environment()
         
-        # Initialize Graphiti with FalkorDB
-        driver = FalkorDriver(
-            host=os.getenv("FALKORDB_HOST", "localhost"),
-            port=int(os.getenv("FALKORDB_PORT", "6379"))
-        )
-        graphiti = Graphiti(graph_driver=driver)
+        # Initialize Graphiti with FalkorDB (pooled, with the shared embedding cache)
+        graphiti = create_graphiti()
         
         print("Connected to Graphiti knowledge base")
         
@@ -70,6 +65,7 @@ async def check_knowledge():
             print(f"Content preview: {str(result)[:200]}...")
         
         print("\nSUCCESS: Knowledge base check completed!")
+        await close_graphiti(graphiti)
         
     except Exception as e:
         print(f"ERROR: Error checking Graphiti knowledge base: {e}")
@@ -3,21 +3,34 @@
 Show a specific episode from the knowledge base
 """
 
-import json
+import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
+from knowledge_manifest import load_manifest
+from knowledge_store import open_store
+
+KNOWLEDGE_BASE_FILE = '../data/toastmasters_knowledge.json'
+
 def show_episode(episode_id):
     """Show a specific episode by index"""
     
-    with open('../data/toastmasters_knowledge.json', 'r', encoding='utf-8') as f:
-        kb = json.load(f)
+    store = open_store(KNOWLEDGE_BASE_FILE)
+    if store:
+        # Reads just this row from the SQLite store
+        episode = store.get_episode(episode_id)
+        total = store.count()
+    else:
+        # Reads the manifest and just this episode's bytes from the bodies file
+        kb = load_manifest(KNOWLEDGE_BASE_FILE)
+        total = len(kb.episodes)
+        episode = kb.episode(episode_id)
+        kb.close()
     
-    if episode_id < 0 or episode_id >= len(kb['episodes']):
-        print(f"ERROR: Episode {episode_id} not found. Available episodes: 0-{len(kb['episodes'])-1}")
+    if episode is None:
+        print(f"ERROR: Episode {episode_id} not found. Available episodes: 0-{total-1}")
         return
     
-    episode = kb['episodes'][episode_id]
-    
     print(f"Episode: {episode['title']}")
     print(f"Category: {episode['category']}")
     print(f"Created: {episode['created'][:10]}")
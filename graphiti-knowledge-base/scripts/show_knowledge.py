@@ -3,31 +3,44 @@
 Simple Knowledge Base Display
 """
 
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
+from knowledge_manifest import load_manifest
+from knowledge_store import open_store
+
+KNOWLEDGE_BASE_FILE = '../data/toastmasters_knowledge.json'
 
 def show_knowledge_base():
     """Display the knowledge base contents"""
     
-    if not os.path.exists('../data/toastmasters_knowledge.json'):
+    store = open_store(KNOWLEDGE_BASE_FILE)
+    if store:
+        # Metadata and 100-character previews only; full bodies stay in the store
+        metadata = store.metadata()
+        episodes = store.list_episodes()
+    elif os.path.exists(KNOWLEDGE_BASE_FILE):
+        # The manifest carries metadata and previews; episode bodies are never read
+        kb = load_manifest(KNOWLEDGE_BASE_FILE)
+        metadata = kb.metadata
+        episodes = kb.episodes
+    else:
         print("❌ Knowledge base file not found. Run view_knowledge.py first to create it.")
         return
     
-    with open('../data/toastmasters_knowledge.json', 'r', encoding='utf-8') as f:
-        kb = json.load(f)
-    
     print("TOASTMASTERS AI AGENT KNOWLEDGE BASE")
     print("=" * 60)
-    print(f"Total Episodes: {len(kb['episodes'])}")
-    print(f"Created: {kb['metadata']['created'][:10]}")
-    print(f"Description: {kb['metadata']['description']}")
+    print(f"Total Episodes: {len(episodes)}")
+    print(f"Created: {metadata['created'][:10]}")
+    print(f"Description: {metadata['description']}")
     print()
     
-    for i, episode in enumerate(kb['episodes'], 1):
+    for i, episode in enumerate(episodes, 1):
         print(f"{i}. {episode['title']}")
         print(f"   Category: {episode['category']}")
         print(f"   Entities: {', '.join(episode['entities'][:3])}...")
-        print(f"   Content Preview: {episode['content'][:100]}...")
+        print(f"   Content Preview: {episode['preview']}...")
         print()
     
     print("=" * 60)
@@ -6,12 +6,12 @@ This script tests the knowledge base directly to verify it's working.
 
 import asyncio
 import os
-from graphiti_core import Graphiti
-from graphiti_core.driver.falkordb_driver import FalkorDriver
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
 from config import setup_environment
+from graphiti_client import close_graphiti, create_graphiti
 
 async def test_knowledge_base():
     """Test the knowledge base with sample queries"""
@@ -22,8 +22,7 @@ async def test_knowledge_base():
     
     try:
         # Connect to Graphiti
-        driver = FalkorDriver(host="localhost", port=6379)
-        graphiti = Graphiti(graph_driver=driver)
+        graphiti = create_graphiti()
         print("Connected to Graphiti Knowledge Base")
         
         # Test queries
@@ -45,6 +44,7 @@ async def test_knowledge_base():
                 print(f"   Error: {e}")
         
         print("\nKnowledge base test completed successfully!")
+        await close_graphiti(graphiti)
         
     except Exception as e:
         print(f"Failed to connect to knowledge base: {e}")
@@ -8,7 +8,6 @@ using the real-time ingestion system.
 import asyncio
 import os
 import sys
-from datetime import datetime
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -17,7 +16,10 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
-from config import setup_environment
+from config import GRAPHITI_CONFIG, setup_environment
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
+from ingestion_ledger import IngestionLedger
+from ingestion_pipeline import ingest_episode
 
 try:
     from graphiti_core import Graphiti
@@ -28,7 +30,7 @@ except ImportError:
     GRAPHITI_AVAILABLE = False
     sys.exit(1)
 
-async def update_mentorship_knowledge():
+async def update_mentorship_knowledge(force: bool = False):
     """Update the Graphiti knowledge base with mentorship system implementation"""
     
     try:
@@ -44,6 +46,9 @@ async def update_mentorship_knowledge():
         
         print("Connected to Graphiti knowledge base")
         
+        # Episodes whose content is already in the ledger are skipped
+        ledger = IngestionLedger(GRAPHITI_CONFIG["ledger_path"])
+        
         # Add mentorship system implementation episode
         mentorship_content = """
         Mentorship System Implementation (December 2024):
@@ -163,14 +168,19 @@ async def update_mentorship_knowledge():
         """
         
         # Add the mentorship system episode to Graphiti
-        await graphiti.add_episode(
+        result = await ingest_episode(
+            graphiti,
+            ledger,
             name="Mentorship System Implementation",
             episode_body=mentorship_content,
             source_description="Mentorship system implementation for Toastmasters app",
-            reference_time=datetime.now()
+            force=force
         )
         
-        print("SUCCESS: Mentorship system knowledge added to Graphiti knowledge base")
+        if result["added"]:
+            print(f"SUCCESS: Mentorship system knowledge updated in Graphiti knowledge base ({result['added']} of {result['chunks']} sections re-extracted, {result['removed']} superseded removed)")
+        else:
+            print("SKIPPED: Mentorship system knowledge unchanged since last ingestion (use --force to re-ingest)")
         
         # Add detailed technical implementation episode
         technical_content = """
@@ -669,14 +679,19 @@ async def update_mentorship_knowledge():
         """
         
         # Add the detailed technical implementation episode
-        await graphiti.add_episode(
+        result = await ingest_episode(
+            graphiti,
+            ledger,
             name="Detailed Technical Implementation Guide",
             episode_body=technical_content,
             source_description="Comprehensive technical implementation details for Toastmasters app",
-            reference_time=datetime.now()
+            force=force
         )
         
-        print("SUCCESS: Detailed technical implementation knowledge added to Graphiti knowledge base")
+        if result["added"]:
+            print(f"SUCCESS: Detailed technical implementation knowledge updated in Graphiti knowledge base ({result['added']} of {result['chunks']} sections re-extracted, {result['removed']} superseded removed)")
+        else:
+            print("SKIPPED: Detailed technical implementation knowledge unchanged since last ingestion (use --force to re-ingest)")
         
         # Search to verify the knowledge was added
         print("\nVerifying knowledge base updates...")
@@ -697,4 +712,5 @@ async def update_mentorship_knowledge():
         raise
 
 if __name__ == "__main__":
-    asyncio.run(update_mentorship_knowledge())
+    # Pass --force to re-ingest content the ledger already has
+    asyncio.run(update_mentorship_knowledge(force="--force" in sys.argv))
@@ -6,13 +6,62 @@ This script shows the actual knowledge base contents that would be stored in Gra
 
 import json
 import os
+import sys
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
+from local_knowledge import BM25Index, load_index
+from knowledge_manifest import LazyKnowledgeBase, load_manifest
+from knowledge_store import open_store
+from similarity_search import SIMILARITY_AVAILABLE, TfidfIndex
 
 class KnowledgeBaseViewer:
     def __init__(self):
         self.knowledge_base_file = "../data/toastmasters_knowledge.json"
-        self.knowledge_base = self.load_or_create_knowledge_base()
+        # With an imported SQLite store, listing and search use its indexes and
+        # the JSON file is only parsed if something needs it in full
+        self.store = open_store(self.knowledge_base_file)
+        self._knowledge_base = None
+        self._search_index = None
+        self._manifest = None
+        self._similarity_index = None
+    
+    @property
+    def knowledge_base(self) -> Dict[str, Any]:
+        if self._knowledge_base is None:
+            self._knowledge_base = self.load_or_create_knowledge_base()
+        return self._knowledge_base
+    
+    @property
+    def search_index(self) -> BM25Index:
+        """BM25 index over the JSON episodes, loaded from disk or rebuilt on first search"""
+        if self._search_index is None:
+            if self._knowledge_base is None and not os.path.exists(self.knowledge_base_file):
+                self._knowledge_base = self.create_initial_knowledge_base()
+            episodes = self._knowledge_base["episodes"] if self._knowledge_base else None
+            self._search_index = load_index(self.knowledge_base_file, episodes)
+        return self._search_index
+    
+    @property
+    def manifest(self) -> LazyKnowledgeBase:
+        """Lazily read episodes, so search hits do not need the whole JSON file parsed"""
+        if self._manifest is None:
+            self._manifest = load_manifest(self.knowledge_base_file)
+        return self._manifest
+    
+    @property
+    def similarity_index(self) -> TfidfIndex:
+        """TF-IDF matrix over episodes and their sections, built on first similarity search"""
+        if self._similarity_index is None:
+            self._similarity_index = TfidfIndex(self.episodes())
+        return self._similarity_index
+    
+    def episodes(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """All episodes (or one category's) in file order"""
+        if self.store:
+            return self.store.episodes(category)
+        return [e for e in self.knowledge_base["episodes"] if category is None or e["category"] == category]
     
     def load_or_create_knowledge_base(self) -> Dict[str, Any]:
         """Load existing knowledge base or create initial one"""
@@ -248,36 +297,21 @@ class KnowledgeBaseViewer:
         with open(self.knowledge_base_file, 'w', encoding='utf-8') as f:
             json.dump(knowledge_base, f, indent=2, ensure_ascii=False)
     
-    def search_knowledge(self, query: str) -> List[Dict[str, Any]]:
-        """Search the knowledge base for relevant information"""
-        query_lower = query.lower()
-        results = []
-        
-        for episode in self.knowledge_base["episodes"]:
-            content_lower = episode["content"].lower()
-            entities_lower = " ".join(episode["entities"]).lower()
-            title_lower = episode["title"].lower()
-            
-            # Calculate relevance score based on matches
-            score = 0
-            if query_lower in title_lower:
-                score += 3
-            if query_lower in content_lower:
-                score += 2
-            if any(term in content_lower for term in query_lower.split()):
-                score += 1
-            if any(term in entities_lower for term in query_lower.split()):
-                score += 1
-            
-            if score > 0:
-                results.append({
-                    **episode,
-                    "relevance_score": score
-                })
-        
-        # Sort by relevance score
-        results.sort(key=lambda x: x["relevance_score"], reverse=True)
-        return results
+    def search_knowledge(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Search the knowledge base, best BM25 matches first (all matches when limit is None)"""
+        if self.store:
+            return [{**episode, "relevance_score": round(score, 2)} for episode, score in self.store.search(query, limit)]
+        hits = self.search_index.search(query, limit)
+        if self._knowledge_base:
+            return [{**self._knowledge_base["episodes"][i], "relevance_score": round(score, 2)} for i, score in hits]
+        return [{**self.manifest.episode(i), "relevance_score": round(score, 2)} for i, score in hits]
+    
+    def similarity_search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Episodes and sections ranked by TF-IDF cosine similarity"""
+        return [
+            {**result.episode, "section": result.section, "excerpt": result.text, "similarity": round(result.score, 3)}
+            for result in self.similarity_index.search(query, limit)
+        ]
     
     def display_episode(self, episode: Dict[str, Any]):
         """Display a single episode"""
@@ -292,16 +326,23 @@ class KnowledgeBaseViewer:
     
     def display_summary(self):
         """Display knowledge base summary"""
+        if self.store:
+            metadata = self.store.metadata()
+            listing = self.store.list_episodes()
+        else:
+            metadata = self.knowledge_base["metadata"]
+            listing = self.knowledge_base["episodes"]
+        
         print("🧠 TOASTMASTERS AI AGENT KNOWLEDGE BASE")
         print("=" * 60)
-        print(f"📊 Total Episodes: {len(self.knowledge_base['episodes'])}")
-        print(f"🕒 Created: {self.knowledge_base['metadata']['created'][:10]}")
-        print(f"📝 Description: {self.knowledge_base['metadata']['description']}")
+        print(f"📊 Total Episodes: {len(listing)}")
+        print(f"🕒 Created: {metadata['created'][:10]}")
+        print(f"📝 Description: {metadata['description']}")
         print()
         
         # Group by category
         categories = {}
-        for episode in self.knowledge_base["episodes"]:
+        for episode in listing:
             cat = episode["category"]
             if cat not in categories:
                 categories[cat] = []
@@ -338,7 +379,7 @@ class KnowledgeBaseViewer:
             for i, result in enumerate(results, 1):
                 print(f"\n{i}. {result['title']}")
                 print(f"   Category: {result['category']}")
-                print(f"   Relevance: {result['relevance_score']}/5")
+                print(f"   Relevance: {result['relevance_score']:.2f}")
                 print(f"   Preview: {result['content'][:150]}...")
             
             # Ask if user wants to see full content
@@ -350,6 +391,35 @@ class KnowledgeBaseViewer:
                 except (ValueError, IndexError):
                     pass
 
+    def interactive_similarity_search(self):
+        """Run the TF-IDF similarity search interface"""
+        if not SIMILARITY_AVAILABLE:
+            print("\n❌ Similarity search needs NumPy and SciPy: pip install numpy scipy")
+            return
+        while True:
+            print("\n🧭 Similarity Search (TF-IDF)")
+            print("=" * 40)
+            query = input("Describe what you are looking for (or 'quit' to exit): ").strip()
+            
+            if query.lower() in ['quit', 'exit', 'q']:
+                break
+            
+            if not query:
+                continue
+            
+            results = self.similarity_search(query)
+            
+            if not results:
+                print(f"\n❌ Nothing similar to '{query}'")
+                continue
+            
+            print(f"\n✅ Closest matches for '{query}':")
+            for i, result in enumerate(results, 1):
+                where = f"section {result['section'] + 1}" if result['section'] is not None else "whole episode"
+                print(f"\n{i}. {result['title']} ({where})")
+                print(f"   Similarity: {result['similarity']:.3f}")
+                print(f"   Excerpt: {' '.join(result['excerpt'].split())[:150]}...")
+
 def main():
     """Main function"""
     viewer = KnowledgeBaseViewer()
@@ -363,9 +433,10 @@ def main():
         print("2. Search knowledge base")
         print("3. View all episodes")
         print("4. View episodes by category")
-        print("5. Exit")
+        print("5. Similarity search (TF-IDF)")
+        print("6. Exit")
         
-        choice = input("\nEnter your choice (1-5): ").strip()
+        choice = input("\nEnter your choice (1-6): ").strip()
         
         if choice == "1":
             viewer.display_summary()
@@ -376,13 +447,13 @@ def main():
         elif choice == "3":
             print("\n📚 All Knowledge Episodes:")
             print("=" * 60)
-            for episode in viewer.knowledge_base["episodes"]:
+            for episode in viewer.episodes():
                 viewer.display_episode(episode)
             
         elif choice == "4":
             # Group by category
             categories = {}
-            for episode in viewer.knowledge_base["episodes"]:
+            for episode in viewer.episodes():
                 cat = episode["category"]
                 if cat not in categories:
                     categories[cat] = []
@@ -404,13 +475,16 @@ def main():
                 print(f"Error: {e}")
                 
         elif choice == "5":
+            viewer.interactive_similarity_search()
+            
+        elif choice == "6":
             print("\n👋 Goodbye! This is your AI agent's knowledge base.")
             print("💡 In the full Graphiti setup, this would be stored in a graph database")
             print("   and accessible to AI agents through the MCP server.")
             break
             
         else:
-            print("\n❌ Invalid choice. Please enter 1-5.")
+            print("\n❌ Invalid choice. Please enter 1-6.")
 
 if __name__ == "__main__":
     main()